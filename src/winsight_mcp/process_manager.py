@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import ctypes
 import subprocess
 import time
 
 from .types import ProcessResult, WindowInfo, WindowRect
-from .window_manager import find_window
+from .window_manager import POLL_BACKOFF, find_window, find_window_cached
+
+# OpenProcess access rights required by WaitForInputIdle
+SYNCHRONIZE: int = 0x00100000
+PROCESS_QUERY_LIMITED_INFORMATION: int = 0x1000
 
 
 def open_application(
@@ -16,12 +21,12 @@ def open_application(
     timeout: int = 10,
 ) -> ProcessResult:
     """Launch an application and optionally wait for its window to appear."""
-    cmd: list[str] = [command] + (args or [])
+    cmd: list[str] = [command, *args] if args else [command]
     try:
         proc: subprocess.Popen[bytes] = subprocess.Popen(
             cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
         )
     except FileNotFoundError:
@@ -32,7 +37,15 @@ def open_application(
     result: ProcessResult = {"pid": proc.pid, "command": command}
 
     if wait_for_window:
-        window: WindowInfo | None = poll_for_window(wait_for_window, timeout)
+        # One kernel wait for the new GUI to become ready, then a single lookup;
+        # poll only if the window is still missing (e.g. launcher processes).
+        deadline: float = time.monotonic() + timeout
+        wait_for_input_idle(proc.pid, timeout)
+        window: WindowInfo | None = find_window(wait_for_window)
+        if window is None:
+            window = poll_for_window(
+                wait_for_window, max(deadline - time.monotonic(), 0.0)
+            )
         if window:
             result["window"] = _window_rect(window)
         else:
@@ -55,13 +68,31 @@ def _window_rect(w: WindowInfo) -> WindowRect:
     }
 
 
-def poll_for_window(title: str, timeout: int = 10) -> WindowInfo | None:
-    """Poll for a window matching the title to appear."""
-    start: float = time.time()
-    while time.time() - start < timeout:
-        w: WindowInfo | None = find_window(title)
+def wait_for_input_idle(pid: int, timeout: float) -> bool:
+    """Wait until a process is idle waiting for user input.
+
+    Returns False on timeout, if the process cannot be opened, or if it has no
+    message queue (e.g. console programs).
+    """
+    handle: int = ctypes.windll.kernel32.OpenProcess(
+        SYNCHRONIZE | PROCESS_QUERY_LIMITED_INFORMATION, False, pid
+    )
+    if not handle:
+        return False
+    try:
+        return ctypes.windll.user32.WaitForInputIdle(handle, int(timeout * 1000)) == 0
+    finally:
+        ctypes.windll.kernel32.CloseHandle(handle)
+
+
+def poll_for_window(title: str, timeout: float = 10) -> WindowInfo | None:
+    """Poll for a window matching the title to appear, backing off per POLL_BACKOFF."""
+    deadline: float = time.monotonic() + timeout
+    attempt: int = 0
+    while time.monotonic() < deadline:
+        w: WindowInfo | None = find_window_cached(title)
         if w is not None:
             return w
-        elapsed: float = time.time() - start
-        time.sleep(0.2 if elapsed < 5 else 0.5)
+        time.sleep(POLL_BACKOFF[min(attempt, len(POLL_BACKOFF) - 1)])
+        attempt += 1
     return None
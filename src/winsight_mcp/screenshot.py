@@ -2,25 +2,177 @@
 
 from __future__ import annotations
 
+import atexit
 import ctypes
 import io
-from typing import TYPE_CHECKING, cast
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
 
 import mss
+import win32api
+import win32con
 import win32gui
 import win32ui
 from PIL import Image as PILImage
 from PIL import ImageGrab
 
-from .types import BitmapInfo, MonitorInfo
+from .types import MonitorInfo
+
+try:  # optional "fast" extra
+    import imagecodecs
+    import numpy as np
+except ImportError:
+    imagecodecs = None
+    np = None
+
+try:  # optional "dxgi" extra; importing it enumerates DXGI adapters
+    import dxcam
+except (ImportError, OSError):
+    dxcam = None
 
 if TYPE_CHECKING:
+    from ctypes.wintypes import RECT
+
     from _win32typing import PyCBitmap, PyCDC
+    from dxcam import DXCamera, DXFactory
+    from mss.base import MSSBase
     from mss.screenshot import ScreenShot
+    from numpy import ndarray
 
 # PrintWindow flag: capture full DWM-rendered content (Windows 8.1+)
 PW_RENDERFULLCONTENT: int = 2
 
+# GetDIBits: uncompressed pixels, palette-free color usage
+BI_RGB: int = 0
+DIB_RGB_COLORS: int = 0
+
+
+class BITMAPINFO(ctypes.Structure):
+    """Win32 BITMAPINFO: BITMAPINFOHEADER followed by room for three color masks."""
+
+    _fields_ = [
+        ("biSize", ctypes.c_uint32),
+        ("biWidth", ctypes.c_int32),
+        ("biHeight", ctypes.c_int32),
+        ("biPlanes", ctypes.c_uint16),
+        ("biBitCount", ctypes.c_uint16),
+        ("biCompression", ctypes.c_uint32),
+        ("biSizeImage", ctypes.c_uint32),
+        ("biXPelsPerMeter", ctypes.c_int32),
+        ("biYPelsPerMeter", ctypes.c_int32),
+        ("biClrUsed", ctypes.c_uint32),
+        ("biClrImportant", ctypes.c_uint32),
+        ("bmiColors", ctypes.c_uint32 * 3),
+    ]
+
+
+# zlib level for PNG encoding. Deflate dominates encode time on screen-sized
+# bitmaps; level 1 is much faster than Pillow's default (6) for a slightly
+# larger file. PNG is lossless at every level.
+PNG_COMPRESS_LEVEL: int = 1
+
+# mss holds GDI handles that belong to the thread that created them, so the
+# capture instance is cached per thread. Every instance is also tracked so
+# that exit can close the ones owned by capture worker threads.
+_MSS_LOCAL: threading.local = threading.local()
+_all_scts: list[MSSBase] = []
+_scts_lock: threading.Lock = threading.Lock()
+
+
+def _get_sct() -> MSSBase:
+    """Return this thread's mss instance, creating it on first use.
+
+    Reusing the instance avoids re-acquiring device contexts on every capture.
+    Its cached monitor list is not used; see _monitor_layout.
+    """
+    sct: MSSBase | None = getattr(_MSS_LOCAL, "sct", None)
+    if sct is None:
+        sct = mss.mss()
+        _MSS_LOCAL.sct = sct
+        with _scts_lock:
+            _all_scts.append(sct)
+    return sct
+
+
+def _close_sct() -> None:
+    """Close and forget this thread's mss instance, if any."""
+    sct: MSSBase | None = getattr(_MSS_LOCAL, "sct", None)
+    if sct is not None:
+        _MSS_LOCAL.sct = None
+        with _scts_lock:
+            if sct not in _all_scts:
+                return  # already closed by _close_all_scts
+            _all_scts.remove(sct)
+        sct.close()
+
+
+def _close_all_scts() -> None:
+    """Close the mss instances of every thread, at interpreter exit."""
+    with _scts_lock:
+        scts: list[MSSBase] = list(_all_scts)
+        _all_scts.clear()
+    for sct in scts:
+        sct.close()
+
+
+atexit.register(_close_all_scts)
+
+
+def _monitor_layout() -> list[dict[str, int]]:
+    """Read the current monitor layout, in the same format and order as mss.
+
+    Index 0 is the virtual screen spanning every monitor, then one entry per
+    monitor in EnumDisplayMonitors order. mss caches this list for the life of
+    an instance; reading it per capture picks up resolution, DPI, arrangement
+    and attach/detach changes. Call _get_sct() first so that mss has made the
+    process DPI aware and the coordinates are physical pixels.
+    """
+    layout: list[dict[str, int]] = [
+        {
+            "left": win32api.GetSystemMetrics(win32con.SM_XVIRTUALSCREEN),
+            "top": win32api.GetSystemMetrics(win32con.SM_YVIRTUALSCREEN),
+            "width": win32api.GetSystemMetrics(win32con.SM_CXVIRTUALSCREEN),
+            "height": win32api.GetSystemMetrics(win32con.SM_CYVIRTUALSCREEN),
+        }
+    ]
+    for _, _, (left, top, right, bottom) in win32api.EnumDisplayMonitors():
+        layout.append(
+            {"left": left, "top": top, "width": right - left, "height": bottom - top}
+        )
+    return layout
+
+
+# DXGI Desktop Duplication cameras keyed by (adapter, output) index, created on
+# the first capture of each output. Access is serialized across capture threads.
+_dxcams: dict[tuple[int, int], DXCamera] = {}
+_dxcam_lock: threading.Lock = threading.Lock()
+
+# Memory DC + bitmap pairs reused across capture_window_hwnd calls, keyed by
+# (width, height) and kept in least-recently-used order.
+DC_POOL_SIZE: int = 4
+_dc_pool: OrderedDict[tuple[int, int], tuple[PyCDC, PyCBitmap]] = OrderedDict()
+_dc_pool_lock: threading.Lock = threading.Lock()
+
+
+def _encode_png(pil_img: PILImage.Image) -> bytes:
+    """Encode an image as PNG bytes at PNG_COMPRESS_LEVEL.
+
+    Uses imagecodecs (the "fast" extra) when installed, which encodes
+    screen-sized frames noticeably faster than Pillow, and Pillow otherwise.
+    BytesIO.getvalue() hands over the stream's internal buffer without copying
+    when no views are held on it, so no intermediate buffer is needed here.
+    """
+    if imagecodecs is not None and np is not None:
+        # png_encode returns bytes here (no out= buffer); bytes() only narrows
+        # the declared bytes | bytearray and does not copy an exact bytes object
+        return bytes(
+            imagecodecs.png_encode(np.asarray(pil_img), level=PNG_COMPRESS_LEVEL)
+        )
+    buffer: io.BytesIO = io.BytesIO()
+    pil_img.save(buffer, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+    return buffer.getvalue()
+
 
 def list_monitors() -> list[MonitorInfo]:
     """List all available monitors using mss.
@@ -44,81 +196,248 @@ def list_monitors() -> list[MonitorInfo]:
         ]
 
 
+def capture_full_screen_raw(
+    monitor: int = 1,
+) -> tuple[tuple[int, int], bytearray | memoryview]:
+    """Capture the full screen (or a specific monitor) as raw BGRA pixels.
+
+    Returns ((width, height), pixels) with 4 bytes per pixel, top-down rows and
+    no PNG encoding, for callers that process pixels rather than send images.
+    Single monitors are read through DXGI Desktop Duplication when the "dxgi"
+    extra is installed, and through mss (GDI) otherwise.
+    """
+    sct: MSSBase = _get_sct()
+    monitors: list[dict[str, int]] = _monitor_layout()
+    if monitor < 0 or monitor >= len(monitors):
+        raise ValueError(
+            f"Monitor {monitor} not found. Available: 0-{len(monitors) - 1} "
+            f"(0 = all monitors combined)"
+        )
+    mon: dict[str, int] = monitors[monitor]
+    frame: memoryview | None = _grab_dxgi(monitor, mon)
+    if frame is not None:
+        return (mon["width"], mon["height"]), frame
+
+    screenshot: ScreenShot = sct.grab(mon)
+    # ScreenShot.bgra is a bytes() copy of the raw bytearray; hand out the raw
+    # buffer itself to skip one full-frame allocation and memcpy.
+    return screenshot.size, screenshot.raw
+
+
+def _find_dxgi_output(mon: dict[str, int]) -> tuple[int, int] | None:
+    """Return the (adapter, output) index of the DXGI output covering a monitor.
+
+    Outputs are matched on their desktop coordinates across every adapter, so
+    monitors of the same resolution or on a second GPU map to the right one.
+    """
+    # dxcam keeps its DXFactory singleton private; constructing another one
+    # returns the same instance but logs a warning on every call.
+    factory: DXFactory = getattr(dxcam, "__factory")
+    rect: tuple[int, int, int, int] = (
+        mon["left"],
+        mon["top"],
+        mon["left"] + mon["width"],
+        mon["top"] + mon["height"],
+    )
+    for device_idx, outputs in enumerate(factory.outputs):
+        for output_idx, output in enumerate(outputs):
+            output.update_desc()
+            if output.desc is None:
+                continue
+            coords: RECT = output.desc.DesktopCoordinates
+            if (coords.left, coords.top, coords.right, coords.bottom) == rect:
+                return device_idx, output_idx
+    return None
+
+
+def _grab_dxgi(monitor: int, mon: dict[str, int]) -> memoryview | None:
+    """Grab a monitor's BGRA frame with dxcam, or None to fall back to mss.
+
+    Falls back when dxcam is unavailable, for the combined virtual screen
+    (monitor 0), when no DXGI output sits at the monitor's coordinates, when
+    no frame can be read, or when the frame does not match the monitor's size.
+    """
+    if dxcam is None or monitor < 1:
+        return None
+    with _dxcam_lock:
+        try:
+            key: tuple[int, int] | None = _find_dxgi_output(mon)
+            if key is None:
+                return None
+            if key not in _dxcams:
+                _dxcams[key] = dxcam.create(
+                    device_idx=key[0],
+                    output_idx=key[1],
+                    output_color="BGRA",
+                    processor_backend="numpy",
+                )
+            # An unchanged desktop yields no new frame; reuse the previous one
+            frame: ndarray | None = _dxcams[key].grab(new_frame_only=False)
+        except Exception:
+            return None
+    if frame is None or tuple(frame.shape[:2]) != (mon["height"], mon["width"]):
+        return None
+    return frame.data.cast("B")
+
+
+def _release_dxcams() -> None:
+    """Release every DXGI capture camera."""
+    with _dxcam_lock:
+        cameras: list[DXCamera] = list(_dxcams.values())
+        _dxcams.clear()
+    for camera in cameras:
+        camera.release()
+
+
+atexit.register(_release_dxcams)
+
+
 def capture_full_screen(monitor: int = 1) -> bytes:
     """Capture the full screen (or a specific monitor) and return PNG bytes."""
-    with mss.mss() as sct:
-        monitors: list[dict[str, int]] = sct.monitors
-        if monitor < 0 or monitor >= len(monitors):
-            raise ValueError(
-                f"Monitor {monitor} not found. Available: 0-{len(monitors) - 1} "
-                f"(0 = all monitors combined)"
-            )
-        screenshot: ScreenShot = sct.grab(monitors[monitor])
-
-    pil_img: PILImage.Image = PILImage.frombytes(
-        "RGB", screenshot.size, screenshot.bgra, "raw", "BGRX"
+    size, pixels = capture_full_screen_raw(monitor)
+    pil_img: PILImage.Image = PILImage.frombuffer(
+        "RGB",
+        size,
+        pixels,  # pyright: ignore[reportArgumentType]  # any buffer works
+        "raw",
+        "BGRX",
+        0,
+        1,
     )
-    buffer: io.BytesIO = io.BytesIO()
-    pil_img.save(buffer, format="PNG")
-    return buffer.getvalue()
+    return _encode_png(pil_img)
 
 
 def capture_region(x: int, y: int, width: int, height: int) -> bytes:
     """Capture a specific region of the screen and return PNG bytes."""
     bbox: tuple[int, int, int, int] = (x, y, x + width, y + height)
     screenshot: PILImage.Image = ImageGrab.grab(bbox=bbox)
-    buffer: io.BytesIO = io.BytesIO()
-    screenshot.save(buffer, format="PNG")
-    return buffer.getvalue()
+    return _encode_png(screenshot)
 
 
-def capture_window_hwnd(hwnd: int) -> bytes:
+def capture_window_hwnd(
+    hwnd: int, rect: tuple[int, int, int, int] | None = None
+) -> bytes:
     """Capture a window's content using Win32 PrintWindow API.
 
     This captures the actual window content even if it's behind other windows.
+    Pass the window's (left, top, right, bottom) as rect when it is already
+    known to skip the GetWindowRect call.
     """
-    left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+    left, top, right, bottom = rect or win32gui.GetWindowRect(hwnd)
     width: int = right - left
     height: int = bottom - top
 
     if width <= 0 or height <= 0:
         raise ValueError(f"Window has invalid dimensions: {width}x{height}")
 
-    # Create device contexts and bitmap
-    hwnd_dc: int = win32gui.GetWindowDC(hwnd)
-    mfc_dc: PyCDC = win32ui.CreateDCFromHandle(hwnd_dc)
-    save_dc: PyCDC = mfc_dc.CreateCompatibleDC()
-    bitmap: PyCBitmap = win32ui.CreateBitmap()
-    bitmap.CreateCompatibleBitmap(mfc_dc, width, height)
-    save_dc.SelectObject(bitmap)
-
+    save_dc, bitmap = _acquire_dc(hwnd, width, height)
     try:
-        # Use PrintWindow to render the window content into our bitmap
+        # Use PrintWindow to render the window content into our bitmap; the
+        # object swapped out is the DC's previous (default) bitmap
+        previous: PyCBitmap = save_dc.SelectObject(bitmap)
         ctypes.windll.user32.PrintWindow(
             hwnd, save_dc.GetSafeHdc(), PW_RENDERFULLCONTENT
         )
+        # GetDIBits requires the bitmap not to be selected into a DC
+        save_dc.SelectObject(previous)
 
-        # Convert to PIL Image
-        bmp_info: BitmapInfo = cast(
-            BitmapInfo, bitmap.GetInfo()  # pyright: ignore[reportUnknownMemberType]
-        )
-        bmp_bits: bytes = bitmap.GetBitmapBits(True)
-        pil_img: PILImage.Image = PILImage.frombuffer(
-            "RGB",
-            (bmp_info["bmWidth"], bmp_info["bmHeight"]),
-            bmp_bits,
-            "raw",
-            "BGRX",
-            0,
-            1,
+        pixels: ctypes.Array[ctypes.c_ubyte] = _read_bitmap_bgrx(
+            save_dc.GetSafeHdc(), bitmap.GetHandle(), width, height
         )
+    except Exception:
+        # Do not hand a DC in an unknown state back to the pool
+        _delete_dc(save_dc, bitmap)
+        raise
+    _release_dc(width, height, save_dc, bitmap)
+
+    # Pillow reads any buffer-protocol object; its stubs only admit bytes
+    pil_img: PILImage.Image = PILImage.frombuffer(
+        "RGB",
+        (width, height),
+        pixels,  # pyright: ignore[reportArgumentType]
+        "raw",
+        "BGRX",
+        0,
+        1,
+    )
+    return _encode_png(pil_img)
+
+
+def _acquire_dc(hwnd: int, width: int, height: int) -> tuple[PyCDC, PyCBitmap]:
+    """Take a pooled memory DC and bitmap of the given size, or create them.
 
-        buffer: io.BytesIO = io.BytesIO()
-        pil_img.save(buffer, format="PNG")
-        return buffer.getvalue()
+    An entry is removed from the pool while in use, so concurrent captures of
+    the same size never share a bitmap.
+    """
+    with _dc_pool_lock:
+        entry: tuple[PyCDC, PyCBitmap] | None = _dc_pool.pop((width, height), None)
+    if entry is not None:
+        return entry
+
+    hwnd_dc: int = win32gui.GetWindowDC(hwnd)
+    mfc_dc: PyCDC = win32ui.CreateDCFromHandle(hwnd_dc)
+    try:
+        save_dc: PyCDC = mfc_dc.CreateCompatibleDC()
+        bitmap: PyCBitmap = win32ui.CreateBitmap()
+        bitmap.CreateCompatibleBitmap(mfc_dc, width, height)
     finally:
-        # Cleanup Win32 resources even if conversion fails
-        win32gui.DeleteObject(bitmap.GetHandle())
-        save_dc.DeleteDC()
         mfc_dc.DeleteDC()
         win32gui.ReleaseDC(hwnd, hwnd_dc)
+    return save_dc, bitmap
+
+
+def _release_dc(width: int, height: int, save_dc: PyCDC, bitmap: PyCBitmap) -> None:
+    """Return a memory DC and bitmap to the pool, evicting the least recently used."""
+    evicted: list[tuple[PyCDC, PyCBitmap]] = []
+    with _dc_pool_lock:
+        displaced: tuple[PyCDC, PyCBitmap] | None = _dc_pool.pop((width, height), None)
+        if displaced is not None:
+            evicted.append(displaced)
+        _dc_pool[(width, height)] = (save_dc, bitmap)
+        while len(_dc_pool) > DC_POOL_SIZE:
+            evicted.append(_dc_pool.popitem(last=False)[1])
+    for entry in evicted:
+        _delete_dc(*entry)
+
+
+def _delete_dc(save_dc: PyCDC, bitmap: PyCBitmap) -> None:
+    """Free a memory DC and its bitmap."""
+    win32gui.DeleteObject(bitmap.GetHandle())
+    save_dc.DeleteDC()
+
+
+def _clear_dc_pool() -> None:
+    """Free every pooled memory DC and bitmap."""
+    with _dc_pool_lock:
+        entries: list[tuple[PyCDC, PyCBitmap]] = list(_dc_pool.values())
+        _dc_pool.clear()
+    for entry in entries:
+        _delete_dc(*entry)
+
+
+atexit.register(_clear_dc_pool)
+
+
+def _read_bitmap_bgrx(
+    hdc: int, hbitmap: int, width: int, height: int
+) -> ctypes.Array[ctypes.c_ubyte]:
+    """Copy a bitmap's pixels as top-down 32bpp BGRX rows via GetDIBits.
+
+    Unlike GetBitmapBits, the row layout is fixed by the requested format, and
+    the pixels land in a buffer Pillow can read without another copy.
+    """
+    bmi: BITMAPINFO = BITMAPINFO()
+    bmi.biSize = ctypes.sizeof(BITMAPINFO) - ctypes.sizeof(bmi.bmiColors)
+    bmi.biWidth = width
+    bmi.biHeight = -height  # negative height = top-down rows
+    bmi.biPlanes = 1
+    bmi.biBitCount = 32
+    bmi.biCompression = BI_RGB
+
+    pixels: ctypes.Array[ctypes.c_ubyte] = (ctypes.c_ubyte * (width * height * 4))()
+    lines: int = ctypes.windll.gdi32.GetDIBits(
+        hdc, hbitmap, 0, height, pixels, ctypes.byref(bmi), DIB_RGB_COLORS
+    )
+    if lines != height:
+        raise OSError(f"GetDIBits copied {lines} of {height} scan lines")
+    return pixels
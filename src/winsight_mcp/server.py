@@ -2,17 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import cast
 
 from mcp.server.fastmcp import FastMCP, Image
 
+try:  # optional "fast" extra
+    import orjson
+except ImportError:
+    orjson = None
+
 from .screenshot import (
     capture_full_screen,
     capture_region,
     capture_window_hwnd,
     list_monitors as _list_monitors,
 )
-from .types import ProcessResult, PublicWindowInfo, WindowInfo, WindowListEntry
+from .types import (
+    ProcessResult,
+    PublicWindowInfo,
+    WindowInfo,
+    WindowListEntry,
+    WindowOperation,
+)
 from .window_manager import (
     find_window as _find_window,
     focus_window as _focus_window,
@@ -24,25 +38,50 @@ from .window_manager import (
     resize_window as _resize_window,
     restore_window as _restore_window,
     wait_for_window as _wait_for_window,
+    windows_batch as _windows_batch,
 )
 from .process_manager import open_application as _open_application
 
 mcp: FastMCP = FastMCP("WinSight", instructions="Windows Screen Capture MCP Server")
 
+# Capture and PNG encoding run here so the stdio loop keeps serving requests.
+_CAPTURE_POOL: ThreadPoolExecutor = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="winsight-capture"
+)
+
+# State suffix for every (minimized, maximized, active) combination.
+_STATE_LABELS: dict[tuple[bool, bool, bool], str] = {
+    (mini, maxi, active): (" [minimized]" if mini else " [maximized]" if maxi else "")
+    + (" [active]" if active else "")
+    for mini in (False, True)
+    for maxi in (False, True)
+    for active in (False, True)
+}
+
+
+def _dumps(obj: object) -> str:
+    """Serialize a tool result as indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
 
 @mcp.tool()
-def take_screenshot(monitor: int = 1) -> Image:
+async def take_screenshot(monitor: int = 1) -> Image:
     """Capture the full screen or a specific monitor.
 
     Args:
         monitor: Monitor index (0 = all monitors combined, 1 = primary, 2+ = others)
     """
-    data: bytes = capture_full_screen(monitor)
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    data: bytes = await loop.run_in_executor(
+        _CAPTURE_POOL, capture_full_screen, monitor
+    )
     return Image(data=data, format="png")
 
 
 @mcp.tool()
-def screenshot_window(window_title: str) -> Image:
+async def screenshot_window(window_title: str) -> Image:
     """Capture a screenshot of a specific window by its title.
     Uses Win32 PrintWindow API to capture the actual window content,
     even if the window is behind other windows.
@@ -54,12 +93,21 @@ def screenshot_window(window_title: str) -> Image:
     if w is None:
         raise ValueError(f"No window found matching '{window_title}'")
 
-    data: bytes = capture_window_hwnd(w["hwnd"])
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    rect: tuple[int, int, int, int] = (
+        w["left"],
+        w["top"],
+        w["left"] + w["width"],
+        w["top"] + w["height"],
+    )
+    data: bytes = await loop.run_in_executor(
+        _CAPTURE_POOL, capture_window_hwnd, w["hwnd"], rect
+    )
     return Image(data=data, format="png")
 
 
 @mcp.tool()
-def screenshot_region(x: int, y: int, width: int, height: int) -> Image:
+async def screenshot_region(x: int, y: int, width: int, height: int) -> Image:
     """Capture a specific region of the screen.
 
     Args:
@@ -70,7 +118,10 @@ def screenshot_region(x: int, y: int, width: int, height: int) -> Image:
     """
     if width <= 0 or height <= 0:
         raise ValueError(f"Invalid dimensions: {width}x{height}")
-    data: bytes = capture_region(x, y, width, height)
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    data: bytes = await loop.run_in_executor(
+        _CAPTURE_POOL, capture_region, x, y, width, height
+    )
     return Image(data=data, format="png")
 
 
@@ -85,20 +136,15 @@ def list_windows(filter: str | None = None) -> str:
     if not windows:
         return "No visible windows found" + (f" matching '{filter}'" if filter else "")
 
-    lines: list[str] = []
-    for w in windows:
-        state: str = ""
-        if w["minimized"]:
-            state = " [minimized]"
-        elif w["maximized"]:
-            state = " [maximized]"
-        if w["active"]:
-            state += " [active]"
-        lines.append(
-            f"- {w['title']}{state}\n"
-            f"  Position: ({w['left']}, {w['top']}) Size: {w['width']}x{w['height']}"
-        )
-    return f"Found {len(windows)} window(s):\n\n" + "\n".join(lines)
+    # str.join turns a generator into a list anyway; building it directly is
+    # faster than both that and preallocating plus index assignment.
+    lines: list[str] = [
+        f"- {w['title']}{_STATE_LABELS[w['minimized'], w['maximized'], w['active']]}\n"
+        f"  Position: ({w['left']}, {w['top']}) Size: {w['width']}x{w['height']}"
+        for w in windows
+    ]
+    body: str = "\n".join(lines)
+    return f"Found {len(windows)} window(s):\n\n" + body
 
 
 @mcp.tool()
@@ -127,7 +173,7 @@ def open_application(
         timeout: Seconds to wait for the window (default: 10)
     """
     result: ProcessResult = _open_application(command, args, wait_for_window, timeout)
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -140,7 +186,7 @@ def get_window_info(window_title: str) -> str:
     info: PublicWindowInfo | None = _get_window_info(window_title)
     if info is None:
         return f"No window found matching '{window_title}'"
-    return json.dumps(info, indent=2)
+    return _dumps(info)
 
 
 @mcp.tool()
@@ -153,7 +199,7 @@ def list_monitors() -> str:
     monitors = _list_monitors()
     if not monitors:
         return "No monitors found"
-    return json.dumps(monitors, indent=2)
+    return _dumps(monitors)
 
 
 @mcp.tool()
@@ -210,11 +256,30 @@ def restore_window(window_title: str) -> str:
     return _restore_window(window_title)
 
 
+@mcp.tool()
+def windows_batch(operations: list[dict[str, str | int]]) -> str:
+    """Apply several window actions in one call, looking up windows only once.
+
+    Cheaper than calling resize_window, move_window etc. once per window when
+    arranging several windows.
+
+    Args:
+        operations: List of actions, each with "action" ("resize", "move",
+            "minimize", "maximize" or "restore"), "window_title" (partial title),
+            and "width"/"height" for resize or "x"/"y" for move
+    """
+    # pydantic rejects typing.TypedDict before Python 3.12, so the tool takes
+    # plain dicts and the operations are only typed from here on
+    results: list[str] = _windows_batch(cast(list[WindowOperation], operations))
+    return "\n".join(results)
+
+
 @mcp.tool()
 def wait_for_window(window_title: str, timeout: int = 30) -> str:
     """Wait for a window matching the title to appear.
 
-    Uses adaptive polling: 0.2s intervals for the first 5 seconds, then 0.5s.
+    Wakes on window show/rename events, so a new window is reported as soon as it
+    appears; falls back to polling with backoff if event hooks are unavailable.
     Useful after launching an application via Bash to wait for its UI to be ready.
 
     Args:
@@ -70,6 +70,17 @@ class MonitorInfo(TypedDict):
     is_primary: bool
 
 
+class WindowOperation(TypedDict, total=False):
+    """One window action for windows_batch; x/y or width/height as needed."""
+
+    action: str
+    window_title: str
+    x: int
+    y: int
+    width: int
+    height: int
+
+
 class ProcessResult(TypedDict, total=False):
     """Result from open_application."""
 
@@ -3,21 +3,101 @@
 from __future__ import annotations
 
 import ctypes
+import threading
 import time
+from typing import cast
 
 import win32con
 import win32gui
 
-from .types import PublicWindowInfo, WindowInfo, WindowListEntry
+from .types import PublicWindowInfo, WindowInfo, WindowListEntry, WindowOperation
+
+# Sleep schedule (seconds) between window polls, indexed by attempt and capped
+# at the last entry. Starts short so already-running apps are detected quickly.
+POLL_BACKOFF: tuple[float, ...] = (0.025, 0.05, 0.1, 0.2, 0.3, 0.5)
+
+# Longest wait (seconds) for a restored window to leave the minimized state
+# before focusing it, and the IsIconic poll interval while waiting.
+RESTORE_TIMEOUT: float = 0.3
+RESTORE_POLL_INTERVAL: float = 0.01
+
+# How long (seconds) polling loops may reuse one EnumWindows snapshot.
+WINDOW_CACHE_TTL: float = 0.15
+
+# win32con values read once per window in is_candidate/build_window_info,
+# bound here to skip the module attribute lookups in those per-window paths.
+# win32gui functions stay attribute lookups so tests can patch win32gui.
+_GWL_STYLE: int = win32con.GWL_STYLE
+_WS_VISIBLE: int = win32con.WS_VISIBLE
+_SW_SHOWMINIMIZED: int = win32con.SW_SHOWMINIMIZED
+_SW_SHOWMAXIMIZED: int = win32con.SW_SHOWMAXIMIZED
+
+# SetWindowPos flags: change only the size, or only the position
+_SWP_RESIZE_FLAGS: int = win32con.SWP_NOMOVE | win32con.SWP_NOZORDER
+_SWP_MOVE_FLAGS: int = win32con.SWP_NOSIZE | win32con.SWP_NOZORDER
+
+# ShowWindow command for each show-state action accepted by windows_batch.
+_SHOW_COMMANDS: dict[str, int] = {
+    "minimize": win32con.SW_MINIMIZE,
+    "maximize": win32con.SW_MAXIMIZE,
+    "restore": win32con.SW_RESTORE,
+}
+
+# (monotonic timestamp, [(hwnd, title), ...]) of the last titled-window snapshot.
+_window_snapshot: tuple[float, list[tuple[int, str]]] | None = None
+
+# WinEvents that can make a matching top-level window appear: shown, or retitled
+EVENT_OBJECT_SHOW: int = 0x8002
+EVENT_OBJECT_NAMECHANGE: int = 0x800C
+WINEVENT_OUTOFCONTEXT: int = 0x0000
+OBJID_WINDOW: int = 0
+CHILDID_SELF: int = 0
+GA_ROOT: int = 2
+
+# Message-queue waiting and dispatch, which delivers out-of-context WinEvents
+QS_ALLINPUT: int = 0x04FF
+PM_REMOVE: int = 0x0001
+
+WINEVENTPROC = ctypes.WINFUNCTYPE(
+    None,
+    ctypes.c_void_p,  # hWinEventHook
+    ctypes.c_uint32,  # event
+    ctypes.c_void_p,  # hwnd
+    ctypes.c_long,  # idObject
+    ctypes.c_long,  # idChild
+    ctypes.c_uint32,  # idEventThread
+    ctypes.c_uint32,  # dwmsEventTime
+)
+
+
+class MSG(ctypes.Structure):
+    """Win32 MSG, as filled in by PeekMessageW."""
+
+    _fields_ = [
+        ("hwnd", ctypes.c_void_p),
+        ("message", ctypes.c_uint32),
+        ("wParam", ctypes.c_size_t),
+        ("lParam", ctypes.c_ssize_t),
+        ("time", ctypes.c_uint32),
+        ("pt_x", ctypes.c_long),
+        ("pt_y", ctypes.c_long),
+        ("lPrivate", ctypes.c_uint32),
+    ]
 
 
 def is_candidate(hwnd: int, filter_lower: str | None = None) -> str | None:
-    """Return the window title if hwnd is a visible window matching the filter, else None."""
-    if not win32gui.IsWindowVisible(hwnd):
+    """Return the window title if hwnd is a visible window matching the filter, else None.
+
+    Meant for top-level windows: their WS_VISIBLE style bit is exactly what
+    IsWindowVisible reports, without its walk up the parent chain.
+    """
+    if not win32gui.GetWindowLong(hwnd, _GWL_STYLE) & _WS_VISIBLE:
         return None
     title: str = win32gui.GetWindowText(hwnd)
-    is_match: bool = bool(title and title.strip()) and (
-        filter_lower is None or filter_lower in title.lower()
+    is_match: bool = (
+        bool(title)
+        and not title.isspace()
+        and (filter_lower is None or filter_lower in title.lower())
     )
     return title if is_match else None
 
@@ -33,39 +113,65 @@ def build_window_info(hwnd: int, title: str) -> WindowInfo:
         "top": top,
         "width": right - left,
         "height": bottom - top,
-        "minimized": show_cmd == win32con.SW_SHOWMINIMIZED,
-        "maximized": show_cmd == win32con.SW_SHOWMAXIMIZED,
+        "minimized": show_cmd == _SW_SHOWMINIMIZED,
+        "maximized": show_cmd == _SW_SHOWMAXIMIZED,
     }
 
 
+def _collect_hwnd(hwnd: int, ctx: list[int]) -> bool:
+    """EnumWindows callback that only records the hwnd."""
+    ctx.append(hwnd)
+    return True
+
+
+def enum_hwnds() -> list[int]:
+    """Return every top-level hwnd, in Z-order, from one EnumWindows pass.
+
+    The callback only appends, so per-window filtering runs in a plain loop
+    afterwards rather than inside pywin32's callback dispatch.
+    """
+    hwnds: list[int] = []
+    win32gui.EnumWindows(_collect_hwnd, hwnds)
+    return hwnds
+
+
 def list_windows(filter_text: str | None = None) -> list[WindowListEntry]:
     """List visible windows, optionally filtered by title substring."""
     results: list[WindowListEntry] = []
-    filter_lower: str | None = filter_text.lower() if filter_text else None
+    # A blank filter matches every title; skip the per-title lower() for it
+    filter_lower: str | None = (
+        filter_text.lower() if filter_text and not filter_text.isspace() else None
+    )
+    foreground_hwnd: int = win32gui.GetForegroundWindow()
 
-    def enum_callback(hwnd: int, ctx: list[WindowListEntry]) -> bool:
-        """Collect visible window info into ctx for each enumerated hwnd."""
+    for hwnd in enum_hwnds():
         title: str | None = is_candidate(hwnd, filter_lower)
         if title is not None:
-            info: WindowInfo = build_window_info(hwnd, title)
-            ctx.append({**info, "active": hwnd == win32gui.GetForegroundWindow()})
-        return True
-
-    win32gui.EnumWindows(enum_callback, results)
+            # build_window_info returns a fresh dict; extend it rather than copy
+            entry: WindowListEntry = cast(
+                WindowListEntry, build_window_info(hwnd, title)
+            )
+            entry["active"] = hwnd == foreground_hwnd
+            results.append(entry)
     return results
 
 
-def find_window(title: str) -> WindowInfo | None:
-    """Find the first visible window whose title contains the given string (case-insensitive)."""
-    container: list[WindowInfo] = []
+def find_hwnd(title: str) -> tuple[int, str] | None:
+    """Find (hwnd, title) of the first visible window whose title contains title.
 
-    def enum_callback(hwnd: int, ctx: list[WindowInfo]) -> bool:
+    Matching is case-insensitive. Unlike find_window, no rect or placement is
+    read, for callers that only act on the handle.
+    """
+    container: list[tuple[int, str]] = []
+    title_lower: str | None = title.lower() or None
+
+    def enum_callback(hwnd: int, ctx: list[tuple[int, str]]) -> bool:
         """Find the first matching window and stop enumeration."""
         if ctx:
             return False
-        wnd_title: str | None = is_candidate(hwnd, title.lower())
+        wnd_title: str | None = is_candidate(hwnd, title_lower)
         if wnd_title is not None:
-            ctx.append(build_window_info(hwnd, wnd_title))
+            ctx.append((hwnd, wnd_title))
             return False
         return True
 
@@ -77,6 +183,50 @@ def find_window(title: str) -> WindowInfo | None:
     return container[0] if container else None
 
 
+def find_window(title: str) -> WindowInfo | None:
+    """Find the first visible window whose title contains the given string (case-insensitive)."""
+    found: tuple[int, str] | None = find_hwnd(title)
+    if found is None:
+        return None
+    try:
+        return build_window_info(*found)
+    except Exception:
+        return None  # closed since it was enumerated
+
+
+def titled_windows() -> list[tuple[int, str]]:
+    """Return (hwnd, title) for every visible window with a title, in Z-order."""
+    results: list[tuple[int, str]] = []
+    for hwnd in enum_hwnds():
+        title: str | None = is_candidate(hwnd)
+        if title is not None:
+            results.append((hwnd, title))
+    return results
+
+
+def find_window_cached(title: str, ttl: float = WINDOW_CACHE_TTL) -> WindowInfo | None:
+    """Like find_window, but searches a titled-window snapshot up to ttl seconds old.
+
+    Meant for polling loops; one-shot lookups should call find_window.
+    """
+    global _window_snapshot
+    now: float = time.monotonic()
+    if _window_snapshot is None or now - _window_snapshot[0] >= ttl:
+        try:
+            _window_snapshot = (now, titled_windows())
+        except Exception:
+            _window_snapshot = (now, [])
+
+    title_lower: str = title.lower()
+    for hwnd, wnd_title in _window_snapshot[1]:
+        if title_lower in wnd_title.lower():
+            try:
+                return build_window_info(hwnd, wnd_title)
+            except Exception:
+                continue  # closed since the snapshot was taken
+    return None
+
+
 def get_window_info(title: str) -> PublicWindowInfo | None:
     """Get detailed info about a window matching the title."""
     w: WindowInfo | None = find_window(title)
@@ -96,26 +246,31 @@ def get_window_info(title: str) -> PublicWindowInfo | None:
 
 def focus_window(title: str) -> str:
     """Bring a window to the foreground using win32gui with thread-attach trick."""
-    w: WindowInfo | None = find_window(title)
-    if w is None:
+    found: tuple[int, str] | None = find_hwnd(title)
+    if found is None:
         return f"No window found matching '{title}'"
 
-    hwnd: int = w["hwnd"]
+    hwnd, wnd_title = found
     try:
-        if w["minimized"]:
+        show_cmd: int = win32gui.GetWindowPlacement(hwnd)[1]
+        if show_cmd == _SW_SHOWMINIMIZED:
             win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-            time.sleep(0.3)
+            # Focus as soon as the restore completes rather than after a fixed delay
+            deadline: float = time.monotonic() + RESTORE_TIMEOUT
+            while win32gui.IsIconic(hwnd) and time.monotonic() < deadline:
+                time.sleep(RESTORE_POLL_INTERVAL)
 
         force_foreground(hwnd)
-        return f"Window '{w['title']}' is now focused"
+        return f"Window '{wnd_title}' is now focused"
     except Exception as e:
-        return f"Failed to focus window '{w['title']}': {e}"
+        return f"Failed to focus window '{wnd_title}': {e}"
 
 
 def force_foreground(hwnd: int) -> None:
     """Force a window to the foreground, bypassing Windows restrictions."""
     foreground_hwnd: int = win32gui.GetForegroundWindow()
-    current_thread_id: int = ctypes.windll.kernel32.GetCurrentThreadId()
+    # The OS thread id (GetCurrentThreadId on Windows), without a ctypes call
+    current_thread_id: int = threading.get_native_id()
     foreground_thread_id: int = ctypes.windll.user32.GetWindowThreadProcessId(
         foreground_hwnd, None
     )
@@ -138,11 +293,46 @@ def force_foreground(hwnd: int) -> None:
 
 def resize_window(window_title: str, width: int, height: int) -> str:
     """Resize a window to the given dimensions, keeping its current position."""
-    w: WindowInfo | None = find_window(window_title)
-    if w is None:
+    found: tuple[int, str] | None = find_hwnd(window_title)
+    if found is None:
+        return f"No window found matching '{window_title}'"
+    return _resize_hwnd(*found, width, height)
+
+
+def move_window(window_title: str, x: int, y: int) -> str:
+    """Move a window to the given position, keeping its current size."""
+    found: tuple[int, str] | None = find_hwnd(window_title)
+    if found is None:
+        return f"No window found matching '{window_title}'"
+    return _move_hwnd(*found, x, y)
+
+
+def minimize_window(window_title: str) -> str:
+    """Minimize a window."""
+    found: tuple[int, str] | None = find_hwnd(window_title)
+    if found is None:
         return f"No window found matching '{window_title}'"
+    return _show_hwnd(*found, "minimize")
 
-    hwnd: int = w["hwnd"]
+
+def maximize_window(window_title: str) -> str:
+    """Maximize a window."""
+    found: tuple[int, str] | None = find_hwnd(window_title)
+    if found is None:
+        return f"No window found matching '{window_title}'"
+    return _show_hwnd(*found, "maximize")
+
+
+def restore_window(window_title: str) -> str:
+    """Restore a minimized or maximized window to its normal state."""
+    found: tuple[int, str] | None = find_hwnd(window_title)
+    if found is None:
+        return f"No window found matching '{window_title}'"
+    return _show_hwnd(*found, "restore")
+
+
+def _resize_hwnd(hwnd: int, wnd_title: str, width: int, height: int) -> str:
+    """Resize hwnd in place and describe the outcome."""
     try:
         win32gui.SetWindowPos(
             hwnd,
@@ -151,20 +341,15 @@ def resize_window(window_title: str, width: int, height: int) -> str:
             0,
             width,
             height,
-            win32con.SWP_NOMOVE | win32con.SWP_NOZORDER,
+            _SWP_RESIZE_FLAGS,
         )
-        return f"Window '{w['title']}' resized to {width}x{height}"
+        return f"Window '{wnd_title}' resized to {width}x{height}"
     except Exception as e:
-        return f"Failed to resize window '{w['title']}': {e}"
-
+        return f"Failed to resize window '{wnd_title}': {e}"
 
-def move_window(window_title: str, x: int, y: int) -> str:
-    """Move a window to the given position, keeping its current size."""
-    w: WindowInfo | None = find_window(window_title)
-    if w is None:
-        return f"No window found matching '{window_title}'"
 
-    hwnd: int = w["hwnd"]
+def _move_hwnd(hwnd: int, wnd_title: str, x: int, y: int) -> str:
+    """Move hwnd without resizing it and describe the outcome."""
     try:
         win32gui.SetWindowPos(
             hwnd,
@@ -173,67 +358,169 @@ def move_window(window_title: str, x: int, y: int) -> str:
             y,
             0,
             0,
-            win32con.SWP_NOSIZE | win32con.SWP_NOZORDER,
+            _SWP_MOVE_FLAGS,
         )
-        return f"Window '{w['title']}' moved to ({x}, {y})"
+        return f"Window '{wnd_title}' moved to ({x}, {y})"
     except Exception as e:
-        return f"Failed to move window '{w['title']}': {e}"
-
+        return f"Failed to move window '{wnd_title}': {e}"
 
-def minimize_window(window_title: str) -> str:
-    """Minimize a window."""
-    w: WindowInfo | None = find_window(window_title)
-    if w is None:
-        return f"No window found matching '{window_title}'"
 
+def _show_hwnd(hwnd: int, wnd_title: str, action: str) -> str:
+    """Minimize, maximize or restore hwnd and describe the outcome."""
     try:
-        win32gui.ShowWindow(w["hwnd"], win32con.SW_MINIMIZE)
-        return f"Window '{w['title']}' minimized"
+        win32gui.ShowWindow(hwnd, _SHOW_COMMANDS[action])
+        return f"Window '{wnd_title}' {action}d"
     except Exception as e:
-        return f"Failed to minimize window '{w['title']}': {e}"
+        return f"Failed to {action} window '{wnd_title}': {e}"
 
 
-def maximize_window(window_title: str) -> str:
-    """Maximize a window."""
-    w: WindowInfo | None = find_window(window_title)
-    if w is None:
-        return f"No window found matching '{window_title}'"
+def windows_batch(operations: list[WindowOperation]) -> list[str]:
+    """Apply several window actions, enumerating windows only once.
 
+    Each operation has an action ("resize", "move", "minimize", "maximize" or
+    "restore"), a partial window_title, and width/height or x/y where the action
+    needs them. Titles match like find_hwnd, against one shared snapshot.
+    Returns one result message per operation, in order.
+    """
     try:
-        win32gui.ShowWindow(w["hwnd"], win32con.SW_MAXIMIZE)
-        return f"Window '{w['title']}' maximized"
-    except Exception as e:
-        return f"Failed to maximize window '{w['title']}': {e}"
+        windows: list[tuple[int, str, str]] = [
+            (hwnd, title, title.lower()) for hwnd, title in titled_windows()
+        ]
+    except Exception:
+        windows = []
+    return [_apply_operation(op, windows) for op in operations]
 
 
-def restore_window(window_title: str) -> str:
-    """Restore a minimized or maximized window to its normal state."""
-    w: WindowInfo | None = find_window(window_title)
-    if w is None:
-        return f"No window found matching '{window_title}'"
+def _apply_operation(op: WindowOperation, windows: list[tuple[int, str, str]]) -> str:
+    """Run one windows_batch operation against (hwnd, title, title_lower) entries."""
+    action: str = op.get("action", "")
+    window_title: str = op.get("window_title", "")
+    if action not in _SHOW_COMMANDS and action not in ("resize", "move"):
+        return f"Unknown action '{action}' for window '{window_title}'"
 
-    try:
-        win32gui.ShowWindow(w["hwnd"], win32con.SW_RESTORE)
-        return f"Window '{w['title']}' restored"
-    except Exception as e:
-        return f"Failed to restore window '{w['title']}': {e}"
+    title_lower: str = window_title.lower()
+    found: tuple[int, str] | None = next(
+        ((hwnd, title) for hwnd, title, lower in windows if title_lower in lower),
+        None,
+    )
+    if found is None:
+        return f"No window found matching '{window_title}'"
+    if action == "resize":
+        if "width" not in op or "height" not in op:
+            return f"Resize of '{window_title}' needs width and height"
+        return _resize_hwnd(*found, op["width"], op["height"])
+    if action == "move":
+        if "x" not in op or "y" not in op:
+            return f"Move of '{window_title}' needs x and y"
+        return _move_hwnd(*found, op["x"], op["y"])
+    return _show_hwnd(*found, action)
 
 
 def wait_for_window(window_title: str, timeout: int = 30) -> str:
     """Wait for a window matching the title to appear.
 
-    Uses adaptive polling: 0.2s intervals for the first 5 seconds, then 0.5s.
+    Sleeps on window show/rename events (see wait_for_window_event). If the
+    event hooks cannot be installed, polls with a geometric backoff (see
+    POLL_BACKOFF), from 25ms up to 0.5s, reusing window snapshots up to
+    WINDOW_CACHE_TTL old.
     """
-    start: float = time.time()
-    while time.time() - start < timeout:
-        w: WindowInfo | None = find_window(window_title)
-        if w is not None:
-            return f"Window found: '{w['title']}'"
-        elapsed: float = time.time() - start
-        time.sleep(0.2 if elapsed < 5 else 0.5)
+    try:
+        found: WindowInfo | None = wait_for_window_event(window_title, timeout)
+    except OSError:
+        found = _poll_for_window(window_title, timeout)
+    if found is not None:
+        return f"Window found: '{found['title']}'"
     return f"Timed out waiting for window matching '{window_title}' after {timeout}s"
 
 
+def _poll_for_window(window_title: str, timeout: float) -> WindowInfo | None:
+    """Poll for a matching window with backoff until it appears or timeout."""
+    deadline: float = time.monotonic() + timeout
+    attempt: int = 0
+    while time.monotonic() < deadline:
+        w: WindowInfo | None = find_window_cached(window_title)
+        if w is not None:
+            return w
+        time.sleep(POLL_BACKOFF[min(attempt, len(POLL_BACKOFF) - 1)])
+        attempt += 1
+    return None
+
+
+def wait_for_window_event(title: str, timeout: float) -> WindowInfo | None:
+    """Wait for a matching top-level window using WinEvent hooks.
+
+    Blocks in MsgWaitForMultipleObjects and only inspects windows that are
+    shown or retitled, instead of re-enumerating every window on a timer.
+    Returns None on timeout; raises OSError if the hooks cannot be installed.
+    """
+    user32 = ctypes.windll.user32
+    user32.SetWinEventHook.restype = ctypes.c_void_p
+    user32.UnhookWinEvent.argtypes = [ctypes.c_void_p]
+    title_lower: str = title.lower()
+    matches: list[tuple[int, str]] = []
+
+    def on_event(
+        hook: int | None,
+        event: int,
+        hwnd: int | None,
+        id_object: int,
+        id_child: int,
+        thread_id: int,
+        time_ms: int,
+    ) -> None:
+        """Record hwnd if it is a top-level window matching the title."""
+        if matches or not hwnd or id_object != OBJID_WINDOW:
+            return
+        if id_child != CHILDID_SELF or user32.GetAncestor(hwnd, GA_ROOT) != hwnd:
+            return
+        wnd_title: str | None = is_candidate(hwnd, title_lower)
+        if wnd_title is not None:
+            matches.append((hwnd, wnd_title))
+
+    # Must stay referenced while the hooks are installed
+    proc = WINEVENTPROC(on_event)
+    hooks: list[int | None] = [
+        user32.SetWinEventHook(event, event, None, proc, 0, 0, WINEVENT_OUTOFCONTEXT)
+        for event in (EVENT_OBJECT_SHOW, EVENT_OBJECT_NAMECHANGE)
+    ]
+    try:
+        if not all(hooks):
+            raise OSError("SetWinEventHook failed")
+        # The window may already exist, or appear before the hooks were set
+        w: WindowInfo | None = find_window(title)
+        if w is not None:
+            return w
+
+        deadline: float = time.monotonic() + timeout
+        while True:
+            _pump_messages()
+            while matches:
+                hwnd, wnd_title = matches.pop()
+                try:
+                    return build_window_info(hwnd, wnd_title)
+                except Exception:
+                    pass  # closed again before we could read it
+            remaining: float = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            user32.MsgWaitForMultipleObjects(
+                0, None, False, int(remaining * 1000) + 1, QS_ALLINPUT
+            )
+    finally:
+        for hook in hooks:
+            if hook:
+                user32.UnhookWinEvent(hook)
+
+
+def _pump_messages() -> None:
+    """Dispatch every message queued for this thread, delivering WinEvents."""
+    user32 = ctypes.windll.user32
+    msg: MSG = MSG()
+    while user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, PM_REMOVE):
+        user32.TranslateMessage(ctypes.byref(msg))
+        user32.DispatchMessageW(ctypes.byref(msg))
+
+
 def get_window_rect(title: str) -> tuple[int, int, int, int] | None:
     """Get (left, top, width, height) of a window matching the title."""
     w: WindowInfo | None = find_window(title)
@@ -21,7 +21,14 @@ _mock_win32con.SWP_NOMOVE = 0x0002
 _mock_win32con.SWP_NOSIZE = 0x0001
 _mock_win32con.SWP_NOZORDER = 0x0004
 _mock_win32con.HWND_TOP = 0
-
+_mock_win32con.GWL_STYLE = -16
+_mock_win32con.WS_VISIBLE = 0x10000000
+_mock_win32con.SM_XVIRTUALSCREEN = 76
+_mock_win32con.SM_YVIRTUALSCREEN = 77
+_mock_win32con.SM_CXVIRTUALSCREEN = 78
+_mock_win32con.SM_CYVIRTUALSCREEN = 79
+
+sys.modules.setdefault("win32api", MagicMock())
 sys.modules.setdefault("win32gui", MagicMock())
 sys.modules.setdefault("win32ui", MagicMock())
 sys.modules.setdefault("win32con", _mock_win32con)
@@ -32,6 +39,9 @@ if not hasattr(subprocess, "CREATE_NEW_PROCESS_GROUP"):
 if not hasattr(ctypes, "windll"):
     ctypes.windll = MagicMock()
 
+if not hasattr(ctypes, "WINFUNCTYPE"):
+    ctypes.WINFUNCTYPE = ctypes.CFUNCTYPE
+
 # ---------------------------------------------------------------------------
 
 from mcp.server.fastmcp.server import FastMCP
@@ -57,15 +67,21 @@ def sample_window_info() -> WindowInfo:
 
 
 @pytest.fixture
+def sample_window_match(sample_window_info: WindowInfo) -> tuple[int, str]:
+    """The (hwnd, title) pair find_hwnd returns for sample_window_info."""
+    return sample_window_info["hwnd"], sample_window_info["title"]
+
+
+@pytest.fixture(scope="session")
 def mcp_server() -> FastMCP:
     """Return the FastMCP server instance."""
     return _mcp_instance
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fake_png_bytes() -> bytes:
-    """Minimal valid PNG bytes."""
-    img: PILImage.Image = PILImage.new("RGB", (10, 10))
+    """Minimal valid PNG bytes, encoded once per session."""
+    img: PILImage.Image = PILImage.new("RGB", (1, 1))
     buf = BytesIO()
-    img.save(buf, format="PNG")
+    img.save(buf, format="PNG", compress_level=0)
     return buf.getvalue()
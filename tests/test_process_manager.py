@@ -8,8 +8,10 @@ from unittest.mock import MagicMock, patch
 from winsight_mcp.process_manager import (
     poll_for_window,
     open_application,
+    wait_for_input_idle,
 )
 from winsight_mcp.types import ProcessResult, WindowInfo
+from winsight_mcp.window_manager import POLL_BACKOFF
 
 
 # ---------------------------------------------------------------------------
@@ -31,8 +33,8 @@ def test_open_application_success_no_wait(mock_popen: MagicMock) -> None:
     cmd_passed = mock_popen.call_args[0][0]
     assert cmd_passed == ["notepad.exe"]
     _, kwargs = mock_popen.call_args
-    assert kwargs["stdout"] == subprocess.PIPE
-    assert kwargs["stderr"] == subprocess.PIPE
+    assert kwargs["stdout"] == subprocess.DEVNULL
+    assert kwargs["stderr"] == subprocess.DEVNULL
     assert kwargs["creationflags"] == subprocess.CREATE_NEW_PROCESS_GROUP
 
 
@@ -82,17 +84,22 @@ def test_open_application_generic_error(mock_popen: MagicMock) -> None:
     assert "Failed to launch" in result["error"]
 
 
+@patch("winsight_mcp.process_manager.wait_for_input_idle")
+@patch("winsight_mcp.process_manager.find_window")
 @patch("winsight_mcp.process_manager.poll_for_window")
 @patch("winsight_mcp.process_manager.subprocess.Popen")
 def test_open_application_window_found(
     mock_popen: MagicMock,
     mock_wait: MagicMock,
+    mock_find: MagicMock,
+    _mock_idle: MagicMock,
     sample_window_info: WindowInfo,
 ) -> None:
     """When wait_for_window finds the window, result includes window info."""
     mock_proc = MagicMock()
     mock_proc.pid = 5678
     mock_popen.return_value = mock_proc
+    mock_find.return_value = None
     mock_wait.return_value = sample_window_info
 
     result: ProcessResult = open_application("notepad.exe", wait_for_window="Notepad")
@@ -101,15 +108,21 @@ def test_open_application_window_found(
     assert result["window"]["title"] == "Test Window"
 
 
+@patch("winsight_mcp.process_manager.wait_for_input_idle")
+@patch("winsight_mcp.process_manager.find_window")
 @patch("winsight_mcp.process_manager.poll_for_window")
 @patch("winsight_mcp.process_manager.subprocess.Popen")
 def test_open_application_window_timeout(
-    mock_popen: MagicMock, mock_wait: MagicMock
+    mock_popen: MagicMock,
+    mock_wait: MagicMock,
+    mock_find: MagicMock,
+    _mock_idle: MagicMock,
 ) -> None:
     """When wait_for_window times out, result includes a warning."""
     mock_proc = MagicMock()
     mock_proc.pid = 9999
     mock_popen.return_value = mock_proc
+    mock_find.return_value = None
     mock_wait.return_value = None
 
     result: ProcessResult = open_application(
@@ -119,13 +132,75 @@ def test_open_application_window_timeout(
     assert "not found" in result["window_warning"]
 
 
+@patch("winsight_mcp.process_manager.wait_for_input_idle")
+@patch("winsight_mcp.process_manager.find_window")
+@patch("winsight_mcp.process_manager.poll_for_window")
+@patch("winsight_mcp.process_manager.subprocess.Popen")
+def test_open_application_idle_then_found_skips_polling(
+    mock_popen: MagicMock,
+    mock_wait: MagicMock,
+    mock_find: MagicMock,
+    mock_idle: MagicMock,
+    sample_window_info: WindowInfo,
+) -> None:
+    """A window present once the process is input-idle is returned without polling."""
+    mock_proc = MagicMock()
+    mock_proc.pid = 4242
+    mock_popen.return_value = mock_proc
+    mock_idle.return_value = True
+    mock_find.return_value = sample_window_info
+
+    result: ProcessResult = open_application(
+        "notepad.exe", wait_for_window="Test", timeout=5
+    )
+    assert result["window"]["hwnd"] == sample_window_info["hwnd"]
+    mock_idle.assert_called_once_with(4242, 5)
+    mock_find.assert_called_once_with("Test")
+    mock_wait.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# wait_for_input_idle
+# ---------------------------------------------------------------------------
+
+
+@patch("winsight_mcp.process_manager.ctypes")
+def test_wait_for_input_idle_ready(mock_ctypes: MagicMock) -> None:
+    """Returns True when WaitForInputIdle succeeds, and closes the handle."""
+    mock_ctypes.windll.kernel32.OpenProcess.return_value = 77
+    mock_ctypes.windll.user32.WaitForInputIdle.return_value = 0
+
+    assert wait_for_input_idle(1234, 2.5) is True
+    mock_ctypes.windll.user32.WaitForInputIdle.assert_called_once_with(77, 2500)
+    mock_ctypes.windll.kernel32.CloseHandle.assert_called_once_with(77)
+
+
+@patch("winsight_mcp.process_manager.ctypes")
+def test_wait_for_input_idle_timeout(mock_ctypes: MagicMock) -> None:
+    """WAIT_TIMEOUT (or WAIT_FAILED) returns False; the handle is still closed."""
+    mock_ctypes.windll.kernel32.OpenProcess.return_value = 77
+    mock_ctypes.windll.user32.WaitForInputIdle.return_value = 0x102
+
+    assert wait_for_input_idle(1234, 1) is False
+    mock_ctypes.windll.kernel32.CloseHandle.assert_called_once_with(77)
+
+
+@patch("winsight_mcp.process_manager.ctypes")
+def test_wait_for_input_idle_open_fails(mock_ctypes: MagicMock) -> None:
+    """A process that cannot be opened returns False without waiting."""
+    mock_ctypes.windll.kernel32.OpenProcess.return_value = 0
+
+    assert wait_for_input_idle(1234, 1) is False
+    mock_ctypes.windll.user32.WaitForInputIdle.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # poll_for_window
 # ---------------------------------------------------------------------------
 
 
 @patch("winsight_mcp.process_manager.time")
-@patch("winsight_mcp.process_manager.find_window")
+@patch("winsight_mcp.process_manager.find_window_cached")
 def testpoll_for_window_poll_then_find(
     mock_find: MagicMock,
     mock_time: MagicMock,
@@ -133,7 +208,7 @@ def testpoll_for_window_poll_then_find(
 ) -> None:
     """Polls multiple times before finding the window."""
     mock_find.side_effect = [None, None, sample_window_info]
-    mock_time.time.side_effect = [0, 1, 2, 3, 4, 5]
+    mock_time.monotonic.side_effect = [0, 1, 2, 3, 4, 5]
     mock_time.sleep = MagicMock()
 
     result: WindowInfo | None = poll_for_window("Test", timeout=10)
@@ -143,32 +218,33 @@ def testpoll_for_window_poll_then_find(
 
 
 @patch("winsight_mcp.process_manager.time")
-@patch("winsight_mcp.process_manager.find_window")
-def testpoll_for_window_adaptive_sleep(
+@patch("winsight_mcp.process_manager.find_window_cached")
+def testpoll_for_window_backoff_sleep(
     mock_find: MagicMock,
     mock_time: MagicMock,
     sample_window_info: WindowInfo,
 ) -> None:
-    """Sleep interval switches from 0.2s to 0.5s after 5 seconds elapsed."""
-    mock_find.side_effect = [None, None, sample_window_info]
-    mock_time.time.side_effect = [0, 2, 3, 6, 7, 8]
+    """Sleep intervals grow along POLL_BACKOFF between attempts."""
+    mock_find.side_effect = [None, None, None, sample_window_info]
+    mock_time.monotonic.side_effect = [0, 1, 2, 3, 4]
     mock_time.sleep = MagicMock()
 
     poll_for_window("Test", timeout=20)
 
-    mock_time.sleep.assert_any_call(0.2)
-    mock_time.sleep.assert_any_call(0.5)
+    assert [c.args[0] for c in mock_time.sleep.call_args_list] == list(
+        POLL_BACKOFF[:3]
+    )
 
 
 @patch("winsight_mcp.process_manager.time")
-@patch("winsight_mcp.process_manager.find_window")
+@patch("winsight_mcp.process_manager.find_window_cached")
 def testpoll_for_window_timeout_returns_none(
     mock_find: MagicMock,
     mock_time: MagicMock,
 ) -> None:
     """Returns None when timeout expires without finding the window."""
     mock_find.return_value = None
-    mock_time.time.side_effect = [0, 5, 6, 11]
+    mock_time.monotonic.side_effect = [0, 5, 11]
     mock_time.sleep = MagicMock()
 
     result: WindowInfo | None = poll_for_window("Ghost", timeout=10)
@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import functools
+import threading
+from collections.abc import Iterator, Mapping, Sequence
+from types import MappingProxyType
+from typing import NamedTuple
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 from PIL import Image as PILImage
 
+from winsight_mcp import screenshot
 from winsight_mcp.screenshot import (
+    DC_POOL_SIZE,
+    PNG_COMPRESS_LEVEL,
     capture_full_screen,
+    capture_full_screen_raw,
     capture_region,
     capture_window_hwnd,
     list_monitors,
@@ -17,95 +26,365 @@ from winsight_mcp.types import MonitorInfo
 
 PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
 
-_DUAL_MONITORS: list[dict[str, int]] = [
-    {"left": 0, "top": 0, "width": 1920, "height": 1080},
-    {"left": 0, "top": 0, "width": 1920, "height": 1080},
-]
+# Read-only mss-style monitor rects, shared by every layout below. Layouts are
+# tuples: index 0 is the combined virtual screen, then one entry per monitor.
+_MON_1920_AT_0: Mapping[str, int] = MappingProxyType(
+    {"left": 0, "top": 0, "width": 1920, "height": 1080}
+)
+_MON_1920_AT_1920: Mapping[str, int] = MappingProxyType(
+    {"left": 1920, "top": 0, "width": 1920, "height": 1080}
+)
+_COMBINED_3840_AT_0: Mapping[str, int] = MappingProxyType(
+    {"left": 0, "top": 0, "width": 3840, "height": 1080}
+)
+
+# The two entries mss reports for a single 1920x1080 monitor: combined + primary
+_DUAL_MONITORS: tuple[Mapping[str, int], ...] = (_MON_1920_AT_0, _MON_1920_AT_0)
+# Two side-by-side 1920x1080 monitors
+_SIDE_BY_SIDE: tuple[Mapping[str, int], ...] = (
+    _COMBINED_3840_AT_0,
+    _MON_1920_AT_0,
+    _MON_1920_AT_1920,
+)
+# A 3840-wide combined screen with only its primary monitor listed
+_COMBINED_3840: tuple[Mapping[str, int], ...] = (_COMBINED_3840_AT_0, _MON_1920_AT_0)
+
+
+@functools.cache
+def _zeros(size: int) -> bytearray:
+    """Return a shared zero-filled pixel buffer of the given size.
+
+    Captures only read their input buffer, so tests can share one per size
+    instead of allocating multi-megabyte frames each time.
+    """
+    return bytearray(size)
+
+
+@functools.cache
+def _blank_image(width: int, height: int) -> PILImage.Image:
+    """Return a shared black RGB image; encoding only reads it."""
+    return PILImage.new("RGB", (width, height))
+
+
+def _set_layout(
+    mock_win32api: MagicMock, monitors: Sequence[Mapping[str, int]]
+) -> None:
+    """Make the Win32 monitor queries report the given mss-style layout."""
+    virtual: Mapping[str, int] = monitors[0]
+    metrics: dict[int, int] = {
+        76: virtual["left"],
+        77: virtual["top"],
+        78: virtual["width"],
+        79: virtual["height"],
+    }
+    mock_win32api.GetSystemMetrics.side_effect = metrics.__getitem__
+    mock_win32api.EnumDisplayMonitors.return_value = [
+        (i, None, (m["left"], m["top"], m["left"] + m["width"], m["top"] + m["height"]))
+        for i, m in enumerate(monitors[1:], start=1)
+    ]
 
 
 def _setup_mss_mock(
     mock_mss_cls: MagicMock,
-    monitors: list[dict[str, int]] | None = None,
+    monitors: Sequence[Mapping[str, int]] = _DUAL_MONITORS,
 ) -> MagicMock:
-    """Wire up the mss context-manager mock and return the inner sct object."""
-    mock_sct = MagicMock()
-    mock_mss_cls.return_value.__enter__ = MagicMock(return_value=mock_sct)
-    mock_mss_cls.return_value.__exit__ = MagicMock(return_value=False)
-    mock_sct.monitors = monitors if monitors is not None else list(_DUAL_MONITORS)
+    """Wire up the mss instance mock (also usable as a context manager) and return it.
+
+    The same layout is reported by mss (for list_monitors) and by the Win32
+    monitor queries (for captures).
+    """
+    mock_sct: MagicMock = mock_mss_cls.return_value
+    mock_sct.__enter__.return_value = mock_sct
+    mock_sct.__exit__.return_value = False
+    mock_sct.monitors = monitors
+    _set_layout(screenshot.win32api, mock_sct.monitors)
     return mock_sct
 
 
+@pytest.fixture(autouse=True)
+def _mock_win32api() -> Iterator[MagicMock]:
+    """Give each test its own stand-in for the Win32 monitor queries."""
+    with patch("winsight_mcp.screenshot.win32api") as mock_win32api:
+        yield mock_win32api
+
+
+@pytest.fixture
+def mock_mss_cls(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace mss.mss for the test with a MagicMock and return it."""
+    mock_cls = MagicMock()
+    monkeypatch.setattr(screenshot.mss, "mss", mock_cls)
+    return mock_cls
+
+
+@pytest.fixture(autouse=True)
+def _fresh_mss_instance() -> Iterator[None]:
+    """Drop the cached per-thread mss instance so each test sees its own mock."""
+    screenshot._close_sct()
+    yield
+    screenshot._close_sct()
+
+
+@pytest.fixture(autouse=True)
+def _no_dxcams() -> Iterator[None]:
+    """Start and end each test with no cached DXGI cameras."""
+    screenshot._dxcams.clear()
+    yield
+    screenshot._dxcams.clear()
+
+
+@pytest.fixture(autouse=True)
+def _empty_dc_pool() -> Iterator[None]:
+    """Start and end each test with no pooled window-capture DCs."""
+    screenshot._dc_pool.clear()
+    yield
+    screenshot._dc_pool.clear()
+
+
 # ---------------------------------------------------------------------------
 # capture_full_screen
 # ---------------------------------------------------------------------------
 
 
-@patch("winsight_mcp.screenshot.mss.mss")
-def test_capture_full_screen_default_monitor(mock_mss_cls: MagicMock) -> None:
-    """Captures monitor 1 and returns valid PNG bytes."""
-    mock_sct: MagicMock = _setup_mss_mock(mock_mss_cls)
+@pytest.mark.parametrize(
+    ("monitors", "index", "size"),
+    [
+        (_DUAL_MONITORS, 1, (1920, 1080)),
+        (_COMBINED_3840, 0, (3840, 1080)),
+    ],
+    ids=["default_monitor", "all_monitors"],
+)
+def test_capture_full_screen(
+    monitors: Sequence[Mapping[str, int]],
+    index: int,
+    size: tuple[int, int],
+    mock_mss_cls: MagicMock,
+) -> None:
+    """Captures the requested monitor (0 = combined) and returns valid PNG bytes."""
+    mock_sct: MagicMock = _setup_mss_mock(mock_mss_cls, monitors)
     mock_screenshot = MagicMock()
-    mock_screenshot.size = (1920, 1080)
-    mock_screenshot.bgra = b"\x00" * (1920 * 1080 * 4)
+    mock_screenshot.size = size
+    mock_screenshot.raw = _zeros(size[0] * size[1] * 4)
     mock_sct.grab.return_value = mock_screenshot
 
-    result: bytes = capture_full_screen(1)
+    result: bytes = capture_full_screen(index)
     assert result[:8] == PNG_MAGIC
-    mock_sct.grab.assert_called_once_with(mock_sct.monitors[1])
+    mock_sct.grab.assert_called_once_with(monitors[index])
 
 
-@patch("winsight_mcp.screenshot.mss.mss")
-def test_capture_full_screen_invalid_monitor(mock_mss_cls: MagicMock) -> None:
-    """Out-of-range monitor index raises ValueError."""
-    _setup_mss_mock(mock_mss_cls)
+@pytest.mark.parametrize(
+    ("monitors", "index"),
+    [
+        (_DUAL_MONITORS, 5),
+        (_DUAL_MONITORS, -1),
+        (_DUAL_MONITORS[:1], 1),
+    ],
+    ids=["invalid_monitor", "negative_monitor", "single_monitor"],
+)
+def test_capture_full_screen_out_of_range(
+    monitors: Sequence[Mapping[str, int]], index: int, mock_mss_cls: MagicMock
+) -> None:
+    """Monitor indexes outside the layout raise ValueError."""
+    _setup_mss_mock(mock_mss_cls, monitors)
 
-    with pytest.raises(ValueError, match="Monitor 5 not found"):
-        capture_full_screen(5)
+    with pytest.raises(ValueError, match=f"Monitor {index} not found"):
+        capture_full_screen(index)
 
 
-@patch("winsight_mcp.screenshot.mss.mss")
-def test_capture_full_screen_negative_monitor(mock_mss_cls: MagicMock) -> None:
-    """Negative monitor index raises ValueError."""
-    _setup_mss_mock(mock_mss_cls)
+def test_capture_full_screen_raw_returns_unencoded_buffer(
+    mock_mss_cls: MagicMock,
+) -> None:
+    """The raw variant hands back mss's BGRA buffer itself, without PNG encoding."""
+    mock_sct: MagicMock = _setup_mss_mock(mock_mss_cls)
+    mock_screenshot = MagicMock()
+    mock_screenshot.size = (1920, 1080)
+    mock_screenshot.raw = _zeros(1920 * 1080 * 4)
+    mock_sct.grab.return_value = mock_screenshot
 
-    with pytest.raises(ValueError, match="Monitor -1 not found"):
-        capture_full_screen(-1)
+    size, pixels = capture_full_screen_raw(1)
+    assert size == (1920, 1080)
+    assert pixels is mock_screenshot.raw
 
 
-@patch("winsight_mcp.screenshot.mss.mss")
-def test_capture_full_screen_single_monitor(mock_mss_cls: MagicMock) -> None:
-    """With only the combined monitor (index 0), index 1 raises ValueError."""
-    _setup_mss_mock(
-        mock_mss_cls,
-        monitors=[
-            {"left": 0, "top": 0, "width": 1920, "height": 1080},
-        ],
+def _set_dxgi_outputs(
+    mock_dxcam: MagicMock, adapters: list[list[tuple[int, int, int, int]]]
+) -> None:
+    """Make dxcam's factory report outputs at the given desktop rects, per adapter."""
+    factory = MagicMock()
+    factory.outputs = [
+        [
+            MagicMock(
+                desc=MagicMock(
+                    DesktopCoordinates=MagicMock(
+                        left=left, top=top, right=right, bottom=bottom
+                    )
+                )
+            )
+            for left, top, right, bottom in outputs
+        ]
+        for outputs in adapters
+    ]
+    setattr(mock_dxcam, "__factory", factory)
+
+
+def _dxgi_frame(width: int, height: int) -> MagicMock:
+    """Return a stand-in for a dxcam BGRA frame of the given size."""
+    frame = MagicMock()
+    frame.shape = (height, width, 4)
+    frame.data = memoryview(_zeros(width * height * 4))
+    return frame
+
+
+@patch("winsight_mcp.screenshot.dxcam")
+def test_capture_full_screen_prefers_dxgi(
+    mock_dxcam: MagicMock, mock_mss_cls: MagicMock
+) -> None:
+    """With dxcam available, a single monitor is grabbed through DXGI."""
+    mock_sct: MagicMock = _setup_mss_mock(mock_mss_cls)
+    _set_dxgi_outputs(mock_dxcam, [[(0, 0, 1920, 1080)]])
+    camera: MagicMock = mock_dxcam.create.return_value
+    camera.grab.return_value = _dxgi_frame(1920, 1080)
+
+    result: bytes = capture_full_screen(1)
+    capture_full_screen(1)
+    assert result[:8] == PNG_MAGIC
+    mock_dxcam.create.assert_called_once_with(
+        device_idx=0, output_idx=0, output_color="BGRA", processor_backend="numpy"
     )
+    camera.grab.assert_called_with(new_frame_only=False)
+    mock_sct.grab.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [None, _dxgi_frame(1280, 720)],
+    ids=["no_frame", "size_mismatch"],
+)
+@patch("winsight_mcp.screenshot.dxcam")
+def test_capture_full_screen_dxgi_falls_back_to_mss(
+    mock_dxcam: MagicMock, frame: MagicMock | None, mock_mss_cls: MagicMock
+) -> None:
+    """A missing or mismatched DXGI frame falls back to an mss grab."""
+    mock_sct: MagicMock = _setup_mss_mock(mock_mss_cls)
+    _set_dxgi_outputs(mock_dxcam, [[(0, 0, 1920, 1080)]])
+    mock_dxcam.create.return_value.grab.return_value = frame
+    mock_screenshot = MagicMock()
+    mock_screenshot.size = (1920, 1080)
+    mock_screenshot.raw = _zeros(1920 * 1080 * 4)
+    mock_sct.grab.return_value = mock_screenshot
 
-    with pytest.raises(ValueError, match="Monitor 1 not found"):
-        capture_full_screen(1)
+    size, pixels = capture_full_screen_raw(1)
+    assert size == (1920, 1080)
+    assert pixels is mock_screenshot.raw
 
 
-@patch("winsight_mcp.screenshot.mss.mss")
-def test_capture_full_screen_all_monitors(mock_mss_cls: MagicMock) -> None:
-    """Monitor index 0 captures the combined virtual screen."""
-    mock_sct: MagicMock = _setup_mss_mock(
-        mock_mss_cls,
-        monitors=[
-            {"left": 0, "top": 0, "width": 3840, "height": 1080},
-            {"left": 0, "top": 0, "width": 1920, "height": 1080},
-        ],
+@patch("winsight_mcp.screenshot.dxcam")
+def test_capture_full_screen_dxgi_matches_output_by_position(
+    mock_dxcam: MagicMock, mock_mss_cls: MagicMock
+) -> None:
+    """Same-size monitors map to the DXGI output at their coordinates."""
+    monitors: list[dict[str, int]] = [
+        {"left": -1920, "top": 0, "width": 3840, "height": 1080},
+        {"left": 0, "top": 0, "width": 1920, "height": 1080},
+        {"left": -1920, "top": 0, "width": 1920, "height": 1080},
+    ]
+    _setup_mss_mock(mock_mss_cls, monitors)
+    _set_dxgi_outputs(mock_dxcam, [[(0, 0, 1920, 1080)], [(-1920, 0, 0, 1080)]])
+    mock_dxcam.create.return_value.grab.return_value = _dxgi_frame(1920, 1080)
+
+    capture_full_screen_raw(2)
+    mock_dxcam.create.assert_called_once_with(
+        device_idx=1, output_idx=0, output_color="BGRA", processor_backend="numpy"
     )
+
+
+@patch("winsight_mcp.screenshot.dxcam")
+def test_capture_full_screen_dxgi_without_matching_output_uses_mss(
+    mock_dxcam: MagicMock, mock_mss_cls: MagicMock
+) -> None:
+    """A monitor with no DXGI output at its coordinates is grabbed with mss."""
+    mock_sct: MagicMock = _setup_mss_mock(mock_mss_cls)
+    _set_dxgi_outputs(mock_dxcam, [[(1920, 0, 3840, 1080)]])
+    mock_screenshot = MagicMock()
+    mock_screenshot.size = (1920, 1080)
+    mock_screenshot.raw = _zeros(1920 * 1080 * 4)
+    mock_sct.grab.return_value = mock_screenshot
+
+    capture_full_screen_raw(1)
+    mock_dxcam.create.assert_not_called()
+    mock_sct.grab.assert_called_once_with(mock_sct.monitors[1])
+
+
+@patch("winsight_mcp.screenshot.dxcam")
+def test_capture_full_screen_all_monitors_skips_dxgi(
+    mock_dxcam: MagicMock, mock_mss_cls: MagicMock
+) -> None:
+    """The combined virtual screen (monitor 0) is always grabbed with mss."""
+    mock_sct: MagicMock = _setup_mss_mock(mock_mss_cls)
     mock_screenshot = MagicMock()
     mock_screenshot.size = (3840, 1080)
-    mock_screenshot.bgra = b"\x00" * (3840 * 1080 * 4)
+    mock_screenshot.raw = _zeros(3840 * 1080 * 4)
     mock_sct.grab.return_value = mock_screenshot
 
-    result: bytes = capture_full_screen(0)
-    assert result[:8] == PNG_MAGIC
+    capture_full_screen_raw(0)
+    mock_dxcam.create.assert_not_called()
     mock_sct.grab.assert_called_once_with(mock_sct.monitors[0])
 
 
+def test_capture_full_screen_reuses_mss_instance(mock_mss_cls: MagicMock) -> None:
+    """Consecutive captures on one thread share a single mss instance."""
+    mock_sct: MagicMock = _setup_mss_mock(mock_mss_cls)
+    mock_screenshot = MagicMock()
+    mock_screenshot.size = (2, 2)
+    mock_screenshot.raw = _zeros(2 * 2 * 4)
+    mock_sct.grab.return_value = mock_screenshot
+
+    capture_full_screen(1)
+    capture_full_screen(1)
+    mock_mss_cls.assert_called_once()
+    assert mock_sct.grab.call_count == 2
+
+
+def test_capture_full_screen_rereads_layout(mock_mss_cls: MagicMock) -> None:
+    """Each capture uses the current layout, not the one at instance creation."""
+    mock_sct: MagicMock = _setup_mss_mock(mock_mss_cls)
+    mock_screenshot = MagicMock()
+    mock_screenshot.size = (2, 2)
+    mock_screenshot.raw = _zeros(2 * 2 * 4)
+    mock_sct.grab.return_value = mock_screenshot
+    capture_full_screen(1)
+
+    rearranged: list[dict[str, int]] = [
+        {"left": -2560, "top": 0, "width": 4480, "height": 1440},
+        {"left": -2560, "top": 0, "width": 2560, "height": 1440},
+        {"left": 0, "top": 0, "width": 1920, "height": 1080},
+    ]
+    _set_layout(screenshot.win32api, rearranged)
+    capture_full_screen(2)
+
+    mock_mss_cls.assert_called_once()
+    assert mock_sct.grab.call_args_list == [
+        call(_DUAL_MONITORS[1]),
+        call(_MON_1920_AT_0),
+    ]
+
+
+def test_close_all_scts_closes_worker_thread_instances(mock_mss_cls: MagicMock) -> None:
+    """Exit cleanup closes instances created on other threads too."""
+    worker_sct = MagicMock()
+    main_sct = MagicMock()
+    mock_mss_cls.side_effect = [worker_sct, main_sct]
+
+    worker: threading.Thread = threading.Thread(target=screenshot._get_sct)
+    worker.start()
+    worker.join()
+    screenshot._get_sct()
+
+    screenshot._close_all_scts()
+    worker_sct.close.assert_called_once()
+    main_sct.close.assert_called_once()
+    assert screenshot._all_scts == []
+
+
 # ---------------------------------------------------------------------------
 # capture_region
 # ---------------------------------------------------------------------------
@@ -114,7 +393,7 @@ def test_capture_full_screen_all_monitors(mock_mss_cls: MagicMock) -> None:
 @patch("winsight_mcp.screenshot.ImageGrab.grab")
 def test_capture_region(mock_grab: MagicMock) -> None:
     """Captures a region and returns valid PNG bytes with correct bbox."""
-    mock_grab.return_value = PILImage.new("RGB", (100, 50))
+    mock_grab.return_value = _blank_image(100, 50)
 
     result: bytes = capture_region(10, 20, 100, 50)
     assert result[:8] == PNG_MAGIC
@@ -124,12 +403,44 @@ def test_capture_region(mock_grab: MagicMock) -> None:
 @patch("winsight_mcp.screenshot.ImageGrab.grab")
 def test_capture_region_passes_negative_coords(mock_grab: MagicMock) -> None:
     """Negative x/y are forwarded to ImageGrab.grab unchanged."""
-    mock_grab.return_value = PILImage.new("RGB", (50, 50))
+    mock_grab.return_value = _blank_image(50, 50)
 
     capture_region(-10, -20, 50, 50)
     mock_grab.assert_called_once_with(bbox=(-10, -20, 40, 30))
 
 
+@patch("winsight_mcp.screenshot.imagecodecs", None)
+@patch("winsight_mcp.screenshot.ImageGrab.grab")
+def test_capture_region_uses_fast_png_level(mock_grab: MagicMock) -> None:
+    """Without imagecodecs, Pillow encodes at PNG_COMPRESS_LEVEL, not its default."""
+    mock_img = MagicMock()
+    mock_grab.return_value = mock_img
+
+    capture_region(0, 0, 10, 10)
+    _, kwargs = mock_img.save.call_args
+    assert kwargs["format"] == "PNG"
+    assert kwargs["compress_level"] == PNG_COMPRESS_LEVEL
+
+
+@patch("winsight_mcp.screenshot.np")
+@patch("winsight_mcp.screenshot.imagecodecs")
+@patch("winsight_mcp.screenshot.ImageGrab.grab")
+def test_capture_region_prefers_imagecodecs(
+    mock_grab: MagicMock, mock_codecs: MagicMock, mock_np: MagicMock
+) -> None:
+    """With the "fast" extra installed, imagecodecs encodes instead of Pillow."""
+    mock_img = MagicMock()
+    mock_grab.return_value = mock_img
+    mock_codecs.png_encode.return_value = PNG_MAGIC
+
+    assert capture_region(0, 0, 10, 10) == PNG_MAGIC
+    mock_np.asarray.assert_called_once_with(mock_img)
+    mock_codecs.png_encode.assert_called_once_with(
+        mock_np.asarray.return_value, level=PNG_COMPRESS_LEVEL
+    )
+    mock_img.save.assert_not_called()
+
+
 @patch("winsight_mcp.screenshot.ImageGrab.grab")
 def test_capture_region_grab_exception(mock_grab: MagicMock) -> None:
     """Exception from ImageGrab.grab propagates to caller."""
@@ -144,96 +455,123 @@ def test_capture_region_grab_exception(mock_grab: MagicMock) -> None:
 # ---------------------------------------------------------------------------
 
 
-def _setup_hwnd_mocks(
-    mock_win32gui: MagicMock,
-    mock_win32ui: MagicMock,
-    width: int = 100,
-    height: int = 80,
-) -> tuple[MagicMock, MagicMock, MagicMock]:
-    """Configure mocks for the full Win32 DC/bitmap chain."""
-    mock_win32gui.GetWindowRect.return_value = (0, 0, width, height)
-    mock_win32gui.GetWindowDC.return_value = 1
-
-    mock_mfc_dc = MagicMock()
-    mock_save_dc = MagicMock()
-    mock_bitmap = MagicMock()
-    mock_win32ui.CreateDCFromHandle.return_value = mock_mfc_dc
-    mock_mfc_dc.CreateCompatibleDC.return_value = mock_save_dc
-    mock_win32ui.CreateBitmap.return_value = mock_bitmap
-
-    mock_bitmap.GetInfo.return_value = {
-        "bmType": 0,
-        "bmWidth": width,
-        "bmHeight": height,
-        "bmWidthBytes": width * 4,
-        "bmPlanes": 1,
-        "bmBitsPixel": 32,
-    }
-    mock_bitmap.GetBitmapBits.return_value = b"\x00" * (width * height * 4)
-    return mock_mfc_dc, mock_save_dc, mock_bitmap
+class HwndMocks(NamedTuple):
+    """Patched Win32 modules and the DC/bitmap mocks they hand out."""
 
+    win32gui: MagicMock
+    win32ui: MagicMock
+    windll: MagicMock
+    mfc_dc: MagicMock
+    save_dc: MagicMock
+    bitmap: MagicMock
 
-@patch("winsight_mcp.screenshot.ctypes")
-@patch("winsight_mcp.screenshot.win32ui")
-@patch("winsight_mcp.screenshot.win32gui")
-def test_capture_window_hwnd_success(
-    mock_win32gui: MagicMock,
-    mock_win32ui: MagicMock,
-    mock_ctypes: MagicMock,
-) -> None:
-    """Captures window content via PrintWindow and returns valid PNG."""
-    _, mock_save_dc, _ = _setup_hwnd_mocks(mock_win32gui, mock_win32ui)
 
+@pytest.fixture
+def hwnd_mocks(monkeypatch: pytest.MonkeyPatch) -> HwndMocks:
+    """Patch the full Win32 DC/bitmap chain for a 100x80 window capture."""
+    mocks = HwndMocks(*(MagicMock() for _ in HwndMocks._fields))
+    monkeypatch.setattr(screenshot, "win32gui", mocks.win32gui)
+    monkeypatch.setattr(screenshot, "win32ui", mocks.win32ui)
+    monkeypatch.setattr(screenshot.ctypes, "windll", mocks.windll)
+
+    mocks.win32gui.GetWindowRect.return_value = (0, 0, 100, 80)
+    mocks.win32gui.GetWindowDC.return_value = 1
+    mocks.win32ui.CreateDCFromHandle.return_value = mocks.mfc_dc
+    mocks.mfc_dc.CreateCompatibleDC.return_value = mocks.save_dc
+    mocks.win32ui.CreateBitmap.return_value = mocks.bitmap
+    mocks.windll.gdi32.GetDIBits.return_value = 80
+    return mocks
+
+
+def test_capture_window_hwnd_success(hwnd_mocks: HwndMocks) -> None:
+    """Captures window content via PrintWindow and returns valid PNG."""
     result: bytes = capture_window_hwnd(42)
     assert result[:8] == PNG_MAGIC
-    mock_win32gui.GetWindowDC.assert_called_once_with(42)
-    mock_ctypes.windll.user32.PrintWindow.assert_called_once_with(
-        42, mock_save_dc.GetSafeHdc(), 2
-    )
+    hwnd_mocks.win32gui.GetWindowDC.assert_called_once_with(42)
+    save_hdc: MagicMock = hwnd_mocks.save_dc.GetSafeHdc()
+    hwnd_mocks.windll.user32.PrintWindow.assert_called_once_with(42, save_hdc, 2)
+    args = hwnd_mocks.windll.gdi32.GetDIBits.call_args[0]
+    assert args[:4] == (save_hdc, hwnd_mocks.bitmap.GetHandle(), 0, 80)
+    assert len(args[4]) == 100 * 80 * 4
 
 
-@patch("winsight_mcp.screenshot.ctypes")
-@patch("winsight_mcp.screenshot.win32ui")
-@patch("winsight_mcp.screenshot.win32gui")
-def test_capture_window_hwnd_cleans_up_resources(
-    mock_win32gui: MagicMock,
-    mock_win32ui: MagicMock,
-    _mock_ctypes: MagicMock,
+def test_capture_window_hwnd_known_rect_skips_get_window_rect(
+    hwnd_mocks: HwndMocks,
 ) -> None:
-    """All Win32 resources (DC, bitmap) are properly released after capture."""
-    mock_mfc_dc, mock_save_dc, mock_bitmap = _setup_hwnd_mocks(
-        mock_win32gui, mock_win32ui
+    """A caller-supplied rect sizes the capture without calling GetWindowRect."""
+    hwnd_mocks.windll.gdi32.GetDIBits.return_value = 48
+
+    capture_window_hwnd(42, (10, 20, 74, 68))
+    hwnd_mocks.win32gui.GetWindowRect.assert_not_called()
+    hwnd_mocks.bitmap.CreateCompatibleBitmap.assert_called_once_with(
+        hwnd_mocks.mfc_dc, 64, 48
     )
 
+
+def test_capture_window_hwnd_deselects_bitmap_before_read(
+    hwnd_mocks: HwndMocks,
+) -> None:
+    """The bitmap is swapped out of the memory DC before GetDIBits reads it."""
+    previous = MagicMock()
+    hwnd_mocks.save_dc.SelectObject.return_value = previous
+
     capture_window_hwnd(42)
+    assert hwnd_mocks.save_dc.SelectObject.call_args_list == [
+        call(hwnd_mocks.bitmap),
+        call(previous),
+    ]
+
 
-    mock_win32gui.DeleteObject.assert_called_once_with(mock_bitmap.GetHandle())
-    mock_save_dc.DeleteDC.assert_called_once()
-    mock_mfc_dc.DeleteDC.assert_called_once()
-    mock_win32gui.ReleaseDC.assert_called_once_with(42, 1)
+def test_capture_window_hwnd_pools_dc_and_bitmap(hwnd_mocks: HwndMocks) -> None:
+    """The window DC is released, while the memory DC and bitmap are kept for reuse."""
+    capture_window_hwnd(42)
 
+    hwnd_mocks.mfc_dc.DeleteDC.assert_called_once()
+    hwnd_mocks.win32gui.ReleaseDC.assert_called_once_with(42, 1)
+    hwnd_mocks.win32gui.DeleteObject.assert_not_called()
+    hwnd_mocks.save_dc.DeleteDC.assert_not_called()
+    assert screenshot._dc_pool[(100, 80)] == (hwnd_mocks.save_dc, hwnd_mocks.bitmap)
 
-@patch("winsight_mcp.screenshot.ctypes")
-@patch("winsight_mcp.screenshot.win32ui")
-@patch("winsight_mcp.screenshot.win32gui")
-def test_capture_window_hwnd_cleanup_on_exception(
-    mock_win32gui: MagicMock,
-    mock_win32ui: MagicMock,
-    _mock_ctypes: MagicMock,
+
+def test_capture_window_hwnd_reuses_pooled_dc(hwnd_mocks: HwndMocks) -> None:
+    """A second capture of the same size skips DC and bitmap creation."""
+    capture_window_hwnd(42)
+    capture_window_hwnd(43)
+
+    hwnd_mocks.win32gui.GetWindowDC.assert_called_once_with(42)
+    hwnd_mocks.win32ui.CreateBitmap.assert_called_once()
+    assert hwnd_mocks.windll.user32.PrintWindow.call_count == 2
+
+
+def test_capture_window_hwnd_evicts_least_recently_used(
+    hwnd_mocks: HwndMocks,
 ) -> None:
-    """Win32 resources are released even when PIL conversion raises."""
-    mock_mfc_dc, mock_save_dc, mock_bitmap = _setup_hwnd_mocks(
-        mock_win32gui, mock_win32ui
-    )
-    mock_bitmap.GetBitmapBits.return_value = b""
+    """Beyond DC_POOL_SIZE sizes, the oldest pooled entry is freed."""
+    hwnd_mocks.windll.gdi32.GetDIBits.side_effect = lambda *args: args[3]
+    sizes: list[int] = list(range(10, 10 + DC_POOL_SIZE + 1))
+
+    for size in sizes:
+        hwnd_mocks.win32gui.GetWindowRect.return_value = (0, 0, size, size)
+        capture_window_hwnd(42)
 
-    with pytest.raises(ValueError, match="not enough image data"):
+    assert list(screenshot._dc_pool) == [(size, size) for size in sizes[1:]]
+    hwnd_mocks.win32gui.DeleteObject.assert_called_once()
+
+
+def test_capture_window_hwnd_cleanup_on_exception(hwnd_mocks: HwndMocks) -> None:
+    """A failed read frees the DC and bitmap instead of returning them to the pool."""
+    hwnd_mocks.windll.gdi32.GetDIBits.return_value = 0
+
+    with pytest.raises(OSError, match="GetDIBits copied 0 of 80"):
         capture_window_hwnd(42)
 
-    mock_win32gui.DeleteObject.assert_called_once()
-    mock_save_dc.DeleteDC.assert_called_once()
-    mock_mfc_dc.DeleteDC.assert_called_once()
-    mock_win32gui.ReleaseDC.assert_called_once_with(42, 1)
+    hwnd_mocks.win32gui.DeleteObject.assert_called_once_with(
+        hwnd_mocks.bitmap.GetHandle()
+    )
+    hwnd_mocks.save_dc.DeleteDC.assert_called_once()
+    hwnd_mocks.mfc_dc.DeleteDC.assert_called_once()
+    hwnd_mocks.win32gui.ReleaseDC.assert_called_once_with(42, 1)
+    assert not screenshot._dc_pool
 
 
 @pytest.mark.parametrize(
@@ -261,16 +599,11 @@ def test_capture_window_hwnd_invalid_dimensions(
 # ---------------------------------------------------------------------------
 
 
-@patch("winsight_mcp.screenshot.mss.mss")
 def test_list_monitors_dual_setup(mock_mss_cls: MagicMock) -> None:
     """Two real monitors are returned with correct info; index 0 (combined) is skipped."""
     _setup_mss_mock(
         mock_mss_cls,
-        monitors=[
-            {"left": 0, "top": 0, "width": 3840, "height": 1080},  # combined
-            {"left": 0, "top": 0, "width": 1920, "height": 1080},  # primary
-            {"left": 1920, "top": 0, "width": 1920, "height": 1080},  # secondary
-        ],
+        monitors=_SIDE_BY_SIDE,
     )
 
     result: list[MonitorInfo] = list_monitors()
@@ -294,15 +627,11 @@ def test_list_monitors_dual_setup(mock_mss_cls: MagicMock) -> None:
     }
 
 
-@patch("winsight_mcp.screenshot.mss.mss")
 def test_list_monitors_single(mock_mss_cls: MagicMock) -> None:
     """Single monitor setup returns one entry marked as primary."""
     _setup_mss_mock(
         mock_mss_cls,
-        monitors=[
-            {"left": 0, "top": 0, "width": 1920, "height": 1080},  # combined
-            {"left": 0, "top": 0, "width": 1920, "height": 1080},  # only monitor
-        ],
+        monitors=_DUAL_MONITORS,
     )
 
     result: list[MonitorInfo] = list_monitors()
@@ -312,14 +641,11 @@ def test_list_monitors_single(mock_mss_cls: MagicMock) -> None:
     assert result[0]["index"] == 1
 
 
-@patch("winsight_mcp.screenshot.mss.mss")
 def test_list_monitors_no_real_monitors(mock_mss_cls: MagicMock) -> None:
     """If mss only reports the combined monitor, an empty list is returned."""
     _setup_mss_mock(
         mock_mss_cls,
-        monitors=[
-            {"left": 0, "top": 0, "width": 1920, "height": 1080},  # combined only
-        ],
+        monitors=_DUAL_MONITORS[:1],
     )
 
     result: list[MonitorInfo] = list_monitors()
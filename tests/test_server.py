@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from typing import Any, Sequence
 from unittest.mock import MagicMock, patch
 
@@ -18,6 +19,7 @@ import pytest
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.exceptions import ToolError
 
+from winsight_mcp import server
 from winsight_mcp.types import WindowInfo
 
 
@@ -47,7 +49,7 @@ def _text(result: list[Any]) -> str:
 
 
 async def test_all_tools_registered(mcp_server: FastMCP) -> None:
-    """All 14 MCP tools are registered on the server."""
+    """All 15 MCP tools are registered on the server."""
     tools: list[Tool] = await mcp_server.list_tools()
     tool_names: set[str] = {t.name for t in tools}
     expected: set[str] = {
@@ -65,6 +67,7 @@ async def test_all_tools_registered(mcp_server: FastMCP) -> None:
         "maximize_window",
         "restore_window",
         "wait_for_window",
+        "windows_batch",
     }
     assert tool_names == expected
 
@@ -74,7 +77,7 @@ async def test_all_tools_registered(mcp_server: FastMCP) -> None:
 # ---------------------------------------------------------------------------
 
 
-@patch("winsight_mcp.server.capture_full_screen")
+@patch.object(server, "capture_full_screen")
 async def test_take_screenshot_returns_image(
     mock_capture: MagicMock, mcp_server: FastMCP, fake_png_bytes: bytes
 ) -> None:
@@ -86,7 +89,7 @@ async def test_take_screenshot_returns_image(
     mock_capture.assert_called_once_with(1)
 
 
-@patch("winsight_mcp.server.capture_full_screen")
+@patch.object(server, "capture_full_screen")
 async def test_take_screenshot_default_monitor(
     mock_capture: MagicMock, mcp_server: FastMCP, fake_png_bytes: bytes
 ) -> None:
@@ -97,7 +100,23 @@ async def test_take_screenshot_default_monitor(
     mock_capture.assert_called_once_with(1)
 
 
-@patch("winsight_mcp.server.capture_full_screen")
+@patch.object(server, "capture_full_screen")
+async def test_take_screenshot_runs_on_capture_pool(
+    mock_capture: MagicMock, mcp_server: FastMCP, fake_png_bytes: bytes
+) -> None:
+    """Capture and encoding run on a worker thread, off the event loop."""
+    threads: list[str] = []
+
+    def _capture(monitor: int) -> bytes:
+        threads.append(threading.current_thread().name)
+        return fake_png_bytes
+
+    mock_capture.side_effect = _capture
+    await _call(mcp_server, "take_screenshot", {"monitor": 1})
+    assert threads[0].startswith("winsight-capture")
+
+
+@patch.object(server, "capture_full_screen")
 async def test_take_screenshot_invalid_monitor(
     mock_capture: MagicMock, mcp_server: FastMCP
 ) -> None:
@@ -112,8 +131,8 @@ async def test_take_screenshot_invalid_monitor(
 # ---------------------------------------------------------------------------
 
 
-@patch("winsight_mcp.server.capture_window_hwnd")
-@patch("winsight_mcp.server._find_window")
+@patch.object(server, "capture_window_hwnd")
+@patch.object(server, "_find_window")
 async def test_screenshot_window_success(
     mock_find: MagicMock,
     mock_capture: MagicMock,
@@ -129,9 +148,10 @@ async def test_screenshot_window_success(
     )
     assert len(result) == 1
     assert result[0].type == "image"
+    mock_capture.assert_called_once_with(12345, (100, 200, 900, 800))
 
 
-@patch("winsight_mcp.server._find_window")
+@patch.object(server, "_find_window")
 async def test_screenshot_window_not_found(
     mock_find: MagicMock, mcp_server: FastMCP
 ) -> None:
@@ -146,7 +166,7 @@ async def test_screenshot_window_not_found(
 # ---------------------------------------------------------------------------
 
 
-@patch("winsight_mcp.server.capture_region")
+@patch.object(server, "capture_region")
 async def test_screenshot_region_success(
     mock_capture: MagicMock, mcp_server: FastMCP, fake_png_bytes: bytes
 ) -> None:
@@ -180,7 +200,7 @@ async def test_screenshot_region_negative_height(mcp_server: FastMCP) -> None:
 # ---------------------------------------------------------------------------
 
 
-@patch("winsight_mcp.server._list_windows")
+@patch.object(server, "_list_windows")
 async def test_list_windows_with_results(
     mock_list: MagicMock, mcp_server: FastMCP
 ) -> None:
@@ -206,7 +226,7 @@ async def test_list_windows_with_results(
     assert "[maximized]" not in text
 
 
-@patch("winsight_mcp.server._list_windows")
+@patch.object(server, "_list_windows")
 async def test_list_windows_empty(mock_list: MagicMock, mcp_server: FastMCP) -> None:
     """Empty result returns a 'no windows found' message."""
     mock_list.return_value = []
@@ -214,7 +234,7 @@ async def test_list_windows_empty(mock_list: MagicMock, mcp_server: FastMCP) ->
     assert "No visible windows found" in _text(result)
 
 
-@patch("winsight_mcp.server._list_windows")
+@patch.object(server, "_list_windows")
 async def test_list_windows_formatting_states(
     mock_list: MagicMock, mcp_server: FastMCP
 ) -> None:
@@ -252,7 +272,7 @@ async def test_list_windows_formatting_states(
     assert "Position: (0, 0) Size: 1920x1080" in text
 
 
-@patch("winsight_mcp.server._list_windows")
+@patch.object(server, "_list_windows")
 async def test_list_windows_empty_with_filter(
     mock_list: MagicMock, mcp_server: FastMCP
 ) -> None:
@@ -269,7 +289,7 @@ async def test_list_windows_empty_with_filter(
 # ---------------------------------------------------------------------------
 
 
-@patch("winsight_mcp.server._focus_window")
+@patch.object(server, "_focus_window")
 async def test_focus_window_delegates(
     mock_focus: MagicMock, mcp_server: FastMCP
 ) -> None:
@@ -286,7 +306,7 @@ async def test_focus_window_delegates(
 # ---------------------------------------------------------------------------
 
 
-@patch("winsight_mcp.server._open_application")
+@patch.object(server, "_open_application")
 async def test_open_application_returns_json(
     mock_open: MagicMock, mcp_server: FastMCP
 ) -> None:
@@ -299,7 +319,7 @@ async def test_open_application_returns_json(
     assert data["pid"] == 1234
 
 
-@patch("winsight_mcp.server._open_application")
+@patch.object(server, "_open_application")
 async def test_open_application_error_returns_json(
     mock_open: MagicMock, mcp_server: FastMCP
 ) -> None:
@@ -313,7 +333,7 @@ async def test_open_application_error_returns_json(
     assert "Command not found" in data["error"]
 
 
-@patch("winsight_mcp.server._open_application")
+@patch.object(server, "_open_application")
 async def test_open_application_with_wait_for_window(
     mock_open: MagicMock, mcp_server: FastMCP
 ) -> None:
@@ -346,7 +366,7 @@ async def test_open_application_with_wait_for_window(
 # ---------------------------------------------------------------------------
 
 
-@patch("winsight_mcp.server._get_window_info")
+@patch.object(server, "_get_window_info")
 async def test_get_window_info_found(mock_info: MagicMock, mcp_server: FastMCP) -> None:
     """Found window returns JSON with title and no hwnd."""
     mock_info.return_value = {
@@ -366,7 +386,7 @@ async def test_get_window_info_found(mock_info: MagicMock, mcp_server: FastMCP)
     assert data["title"] == "Test"
 
 
-@patch("winsight_mcp.server._get_window_info")
+@patch.object(server, "_get_window_info")
 async def test_get_window_info_not_found(
     mock_info: MagicMock, mcp_server: FastMCP
 ) -> None:
@@ -378,12 +398,29 @@ async def test_get_window_info_not_found(
     assert "No window found" in _text(result)
 
 
+@patch.object(server, "orjson", None)
+def test_dumps_falls_back_to_json() -> None:
+    """Without orjson, _dumps matches json.dumps with indent=2."""
+    payload: dict[str, Any] = {"title": "Test", "size": [800, 600], "active": True}
+    assert server._dumps(payload) == json.dumps(payload, indent=2)
+
+
+@patch.object(server, "orjson")
+def test_dumps_prefers_orjson(mock_orjson: MagicMock) -> None:
+    """With orjson installed, _dumps uses it with two-space indentation."""
+    mock_orjson.dumps.return_value = b'{\n  "title": "Test"\n}'
+    assert server._dumps({"title": "Test"}) == '{\n  "title": "Test"\n}'
+    mock_orjson.dumps.assert_called_once_with(
+        {"title": "Test"}, option=mock_orjson.OPT_INDENT_2
+    )
+
+
 # ---------------------------------------------------------------------------
 # list_monitors
 # ---------------------------------------------------------------------------
 
 
-@patch("winsight_mcp.server._list_monitors")
+@patch.object(server, "_list_monitors")
 async def test_list_monitors_returns_json(
     mock_list: MagicMock, mcp_server: FastMCP
 ) -> None:
@@ -397,7 +434,7 @@ async def test_list_monitors_returns_json(
     assert data[0]["is_primary"] is True
 
 
-@patch("winsight_mcp.server._list_monitors")
+@patch.object(server, "_list_monitors")
 async def test_list_monitors_empty(mock_list: MagicMock, mcp_server: FastMCP) -> None:
     """Empty monitor list returns a 'not found' message."""
     mock_list.return_value = []
@@ -410,7 +447,7 @@ async def test_list_monitors_empty(mock_list: MagicMock, mcp_server: FastMCP) ->
 # ---------------------------------------------------------------------------
 
 
-@patch("winsight_mcp.server._resize_window")
+@patch.object(server, "_resize_window")
 async def test_resize_window_delegates(
     mock_resize: MagicMock, mcp_server: FastMCP
 ) -> None:
@@ -430,7 +467,7 @@ async def test_resize_window_delegates(
 # ---------------------------------------------------------------------------
 
 
-@patch("winsight_mcp.server._move_window")
+@patch.object(server, "_move_window")
 async def test_move_window_delegates(mock_move: MagicMock, mcp_server: FastMCP) -> None:
     """Delegates to _move_window with correct args."""
     mock_move.return_value = "Window 'Test' moved to (100, 200)"
@@ -446,7 +483,7 @@ async def test_move_window_delegates(mock_move: MagicMock, mcp_server: FastMCP)
 # ---------------------------------------------------------------------------
 
 
-@patch("winsight_mcp.server._minimize_window")
+@patch.object(server, "_minimize_window")
 async def test_minimize_window_delegates(
     mock_min: MagicMock, mcp_server: FastMCP
 ) -> None:
@@ -463,7 +500,7 @@ async def test_minimize_window_delegates(
 # ---------------------------------------------------------------------------
 
 
-@patch("winsight_mcp.server._maximize_window")
+@patch.object(server, "_maximize_window")
 async def test_maximize_window_delegates(
     mock_max: MagicMock, mcp_server: FastMCP
 ) -> None:
@@ -480,7 +517,7 @@ async def test_maximize_window_delegates(
 # ---------------------------------------------------------------------------
 
 
-@patch("winsight_mcp.server._restore_window")
+@patch.object(server, "_restore_window")
 async def test_restore_window_delegates(
     mock_restore: MagicMock, mcp_server: FastMCP
 ) -> None:
@@ -492,12 +529,34 @@ async def test_restore_window_delegates(
     assert "restored" in _text(result)
 
 
+# ---------------------------------------------------------------------------
+# windows_batch
+# ---------------------------------------------------------------------------
+
+
+@patch.object(server, "_windows_batch")
+async def test_windows_batch_joins_results(
+    mock_batch: MagicMock, mcp_server: FastMCP
+) -> None:
+    """Passes the operations through and returns one result per line."""
+    mock_batch.return_value = ["Window 'A' minimized", "Window 'B' moved to (0, 0)"]
+    operations: list[dict[str, str | int]] = [
+        {"action": "minimize", "window_title": "A"},
+        {"action": "move", "window_title": "B", "x": 0, "y": 0},
+    ]
+    result: list[Any] = await _call(
+        mcp_server, "windows_batch", {"operations": operations}
+    )
+    assert _text(result) == "Window 'A' minimized\nWindow 'B' moved to (0, 0)"
+    mock_batch.assert_called_once_with(operations)
+
+
 # ---------------------------------------------------------------------------
 # wait_for_window
 # ---------------------------------------------------------------------------
 
 
-@patch("winsight_mcp.server._wait_for_window")
+@patch.object(server, "_wait_for_window")
 async def test_wait_for_window_found(mock_wait: MagicMock, mcp_server: FastMCP) -> None:
     """Returns success message when window is found."""
     mock_wait.return_value = "Window found: 'My App'"
@@ -508,7 +567,7 @@ async def test_wait_for_window_found(mock_wait: MagicMock, mcp_server: FastMCP)
     mock_wait.assert_called_once_with("My App", 10)
 
 
-@patch("winsight_mcp.server._wait_for_window")
+@patch.object(server, "_wait_for_window")
 async def test_wait_for_window_timeout(
     mock_wait: MagicMock, mcp_server: FastMCP
 ) -> None:
@@ -520,7 +579,7 @@ async def test_wait_for_window_timeout(
     assert "Timed out" in _text(result)
 
 
-@patch("winsight_mcp.server._wait_for_window")
+@patch.object(server, "_wait_for_window")
 async def test_wait_for_window_default_timeout(
     mock_wait: MagicMock, mcp_server: FastMCP
 ) -> None:
@@ -535,7 +594,7 @@ async def test_wait_for_window_default_timeout(
 # ---------------------------------------------------------------------------
 
 
-@patch("winsight_mcp.server.mcp")
+@patch.object(server, "mcp")
 def test_main_calls_mcp_run(mock_mcp: MagicMock) -> None:
     """main() starts the server over stdio."""
     from winsight_mcp.server import main
@@ -549,10 +608,19 @@ def test_main_calls_mcp_run(mock_mcp: MagicMock) -> None:
 # ---------------------------------------------------------------------------
 
 
-@patch("winsight_mcp.server.main")
+@patch.object(server, "main")
 def test_dunder_main_calls_main(mock_main: MagicMock) -> None:
     """python -m winsight_mcp invokes main()."""
     import runpy
 
     runpy.run_module("winsight_mcp", run_name="__main__")
     mock_main.assert_called_once()
+
+
+@patch.object(server, "main")
+def test_dunder_main_import_does_not_start_server(mock_main: MagicMock) -> None:
+    """Importing winsight_mcp.__main__ under its module name does not call main()."""
+    import runpy
+
+    runpy.run_module("winsight_mcp.__main__", run_name="winsight_mcp.__main__")
+    mock_main.assert_not_called()
@@ -2,59 +2,65 @@
 
 from __future__ import annotations
 
+import functools
+from typing import Any
+
+import pytest
+
 from winsight_mcp.types import (
     BitmapInfo,
     MonitorInfo,
     PublicWindowInfo,
     WindowInfo,
+    WindowOperation,
     WindowRect,
 )
 
+_WINDOW_INFO_KEYS: frozenset[str] = frozenset(
+    {"title", "hwnd", "left", "top", "width", "height", "minimized", "maximized"}
+)
+_WINDOW_RECT_KEYS: frozenset[str] = frozenset(
+    {"title", "hwnd", "left", "top", "width", "height"}
+)
+_BITMAP_INFO_KEYS: frozenset[str] = frozenset(
+    {"bmType", "bmWidth", "bmHeight", "bmWidthBytes", "bmPlanes", "bmBitsPixel"}
+)
+_MONITOR_INFO_KEYS: frozenset[str] = frozenset(
+    {"index", "width", "height", "x", "y", "is_primary"}
+)
+_WINDOW_OPERATION_KEYS: frozenset[str] = frozenset(
+    {"action", "window_title", "x", "y", "width", "height"}
+)
+
+
+@functools.cache
+def _flat_keys(cls: Any) -> frozenset[str]:
+    """Return every key of a TypedDict, including those declared on its bases.
 
-def test_window_info_keys() -> None:
-    """WindowInfo has the 8 expected keys."""
-    expected: set[str] = {
-        "title",
-        "hwnd",
-        "left",
-        "top",
-        "width",
-        "height",
-        "minimized",
-        "maximized",
-    }
-    assert set(WindowInfo.__annotations__) == expected
+    TypedDict precomputes these as the __required_keys__ and __optional_keys__
+    frozensets, so no annotations need to be walked.
+    """
+    return cls.__required_keys__ | cls.__optional_keys__
+
+
+@pytest.mark.parametrize(
+    ("cls", "expected"),
+    [
+        (WindowInfo, _WINDOW_INFO_KEYS),
+        (WindowRect, _WINDOW_RECT_KEYS),
+        (BitmapInfo, _BITMAP_INFO_KEYS),
+        (MonitorInfo, _MONITOR_INFO_KEYS),
+        (WindowOperation, _WINDOW_OPERATION_KEYS),
+    ],
+    ids=["WindowInfo", "WindowRect", "BitmapInfo", "MonitorInfo", "WindowOperation"],
+)
+def test_keys(cls: Any, expected: frozenset[str]) -> None:
+    """Each TypedDict declares exactly the expected keys."""
+    assert _flat_keys(cls) == expected
 
 
 def test_public_window_info_excludes_hwnd() -> None:
     """PublicWindowInfo does not have 'hwnd'."""
-    all_keys: set[str] = set()
-    for cls in PublicWindowInfo.__mro__:
-        if hasattr(cls, "__annotations__"):
-            all_keys.update(cls.__annotations__)
-    assert "hwnd" not in all_keys
-
-
-def test_window_rect_keys() -> None:
-    """WindowRect has the expected keys."""
-    expected: set[str] = {"title", "hwnd", "left", "top", "width", "height"}
-    assert set(WindowRect.__annotations__) == expected
-
-
-def test_bitmap_info_keys() -> None:
-    """BitmapInfo has the expected keys."""
-    expected: set[str] = {
-        "bmType",
-        "bmWidth",
-        "bmHeight",
-        "bmWidthBytes",
-        "bmPlanes",
-        "bmBitsPixel",
-    }
-    assert set(BitmapInfo.__annotations__) == expected
-
-
-def test_monitor_info_keys() -> None:
-    """MonitorInfo has the 6 expected keys."""
-    expected: set[str] = {"index", "width", "height", "x", "y", "is_primary"}
-    assert set(MonitorInfo.__annotations__) == expected
+    keys: frozenset[str] = _flat_keys(PublicWindowInfo)
+    assert "title" in keys
+    assert "hwnd" not in keys
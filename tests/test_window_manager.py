@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import Any
 from unittest.mock import MagicMock, call, patch
 
 import pytest
 import win32con
 
+from winsight_mcp import window_manager
 from winsight_mcp.types import PublicWindowInfo, WindowInfo, WindowListEntry
 from winsight_mcp.window_manager import (
+    EVENT_OBJECT_SHOW,
+    POLL_BACKOFF,
+    QS_ALLINPUT,
+    RESTORE_POLL_INTERVAL,
+    RESTORE_TIMEOUT,
+    WINDOW_CACHE_TTL,
     build_window_info,
+    enum_hwnds,
     force_foreground,
     is_candidate,
+    find_hwnd,
     find_window,
+    find_window_cached,
     focus_window,
     get_window_info,
     get_window_rect,
@@ -25,6 +35,8 @@ from winsight_mcp.window_manager import (
     resize_window,
     restore_window,
     wait_for_window,
+    wait_for_window_event,
+    windows_batch,
 )
 
 
@@ -40,6 +52,19 @@ def _enum_single(
     return _enum
 
 
+def _enum_many(
+    hwnds: list[int],
+) -> Callable[[Callable[[int, list[Any]], object], list[Any]], None]:
+    """Return an EnumWindows side_effect that enumerates the given hwnds in order."""
+
+    def _enum(callback: Callable[[int, list[Any]], object], ctx: list[Any]) -> None:
+        """Simulate EnumWindows over several window handles."""
+        for hwnd in hwnds:
+            callback(hwnd, ctx)
+
+    return _enum
+
+
 # ---------------------------------------------------------------------------
 # is_candidate
 # ---------------------------------------------------------------------------
@@ -48,7 +73,7 @@ def _enum_single(
 @patch("winsight_mcp.window_manager.win32gui")
 def test_is_candidate_visible_match(mock_gui: MagicMock) -> None:
     """Visible window matching the filter returns its title."""
-    mock_gui.IsWindowVisible.return_value = True
+    mock_gui.GetWindowLong.return_value = win32con.WS_VISIBLE
     mock_gui.GetWindowText.return_value = "My Test Window"
     assert is_candidate(1, "test") == "My Test Window"
 
@@ -56,14 +81,23 @@ def test_is_candidate_visible_match(mock_gui: MagicMock) -> None:
 @patch("winsight_mcp.window_manager.win32gui")
 def test_is_candidate_not_visible(mock_gui: MagicMock) -> None:
     """Invisible window returns None."""
-    mock_gui.IsWindowVisible.return_value = False
+    mock_gui.GetWindowLong.return_value = 0
     assert is_candidate(1, "test") is None
 
 
+@patch("winsight_mcp.window_manager.win32gui")
+def test_is_candidate_checks_visible_style_bit(mock_gui: MagicMock) -> None:
+    """Only the WS_VISIBLE bit of GWL_STYLE decides visibility; no title is read."""
+    mock_gui.GetWindowLong.return_value = ~win32con.WS_VISIBLE & 0xFFFFFFFF
+    assert is_candidate(1, None) is None
+    mock_gui.GetWindowLong.assert_called_once_with(1, win32con.GWL_STYLE)
+    mock_gui.GetWindowText.assert_not_called()
+
+
 @patch("winsight_mcp.window_manager.win32gui")
 def test_is_candidate_empty_title(mock_gui: MagicMock) -> None:
     """Window with empty title returns None."""
-    mock_gui.IsWindowVisible.return_value = True
+    mock_gui.GetWindowLong.return_value = win32con.WS_VISIBLE
     mock_gui.GetWindowText.return_value = ""
     assert is_candidate(1, None) is None
 
@@ -71,15 +105,15 @@ def test_is_candidate_empty_title(mock_gui: MagicMock) -> None:
 @patch("winsight_mcp.window_manager.win32gui")
 def test_is_candidate_filter_no_match(mock_gui: MagicMock) -> None:
     """Window not matching the filter returns None."""
-    mock_gui.IsWindowVisible.return_value = True
+    mock_gui.GetWindowLong.return_value = win32con.WS_VISIBLE
     mock_gui.GetWindowText.return_value = "Other Window"
     assert is_candidate(1, "notepad") is None
 
 
 @patch("winsight_mcp.window_manager.win32gui")
 def test_is_candidate_whitespace_title(mock_gui: MagicMock) -> None:
-    """Title with only spaces is rejected by title.strip()."""
-    mock_gui.IsWindowVisible.return_value = True
+    """Title with only spaces is rejected by title.isspace()."""
+    mock_gui.GetWindowLong.return_value = win32con.WS_VISIBLE
     mock_gui.GetWindowText.return_value = "   "
     assert is_candidate(1, None) is None
 
@@ -87,7 +121,7 @@ def test_is_candidate_whitespace_title(mock_gui: MagicMock) -> None:
 @patch("winsight_mcp.window_manager.win32gui")
 def test_is_candidate_no_filter_with_valid_title(mock_gui: MagicMock) -> None:
     """Visible window with a real title and no filter returns the title."""
-    mock_gui.IsWindowVisible.return_value = True
+    mock_gui.GetWindowLong.return_value = win32con.WS_VISIBLE
     mock_gui.GetWindowText.return_value = "My App"
     assert is_candidate(1, None) == "My App"
 
@@ -173,7 +207,7 @@ def _setup_enum_mock(
 ) -> None:
     """Configure mock_gui for EnumWindows-based tests (list_windows, etc.)."""
     mock_gui.GetForegroundWindow.return_value = foreground_hwnd
-    mock_gui.IsWindowVisible.return_value = True
+    mock_gui.GetWindowLong.return_value = win32con.WS_VISIBLE
 
     def _get_text(hwnd: int) -> str:
         """Return window title for the given hwnd."""
@@ -199,6 +233,16 @@ def _setup_enum_mock(
     mock_gui.EnumWindows.side_effect = _fake_enum
 
 
+@patch("winsight_mcp.window_manager.win32gui")
+def test_enum_hwnds_collects_all_in_order(mock_gui: MagicMock) -> None:
+    """Every enumerated hwnd is returned in order, with no per-window Win32 calls."""
+    _setup_enum_mock(mock_gui, {3: "C", 1: "A", 2: ""})
+
+    assert enum_hwnds() == [3, 1, 2]
+    mock_gui.GetWindowLong.assert_not_called()
+    mock_gui.GetWindowText.assert_not_called()
+
+
 @patch("winsight_mcp.window_manager.win32gui")
 def test_list_windows_with_results(mock_gui: MagicMock) -> None:
     """Returns all visible windows with correct active flag."""
@@ -212,6 +256,15 @@ def test_list_windows_with_results(mock_gui: MagicMock) -> None:
     assert result[1]["active"] is False
 
 
+@patch("winsight_mcp.window_manager.win32gui")
+def test_list_windows_reads_foreground_once(mock_gui: MagicMock) -> None:
+    """The foreground window is queried once per call, not once per window."""
+    _setup_enum_mock(mock_gui, {1: "Window A", 2: "Window B", 3: "Window C"})
+
+    list_windows()
+    mock_gui.GetForegroundWindow.assert_called_once()
+
+
 @patch("winsight_mcp.window_manager.win32gui")
 def test_list_windows_with_filter(mock_gui: MagicMock) -> None:
     """Filter returns only windows matching the substring."""
@@ -231,11 +284,20 @@ def test_list_windows_empty_string_filter(mock_gui: MagicMock) -> None:
     assert len(result) == 2
 
 
+@patch("winsight_mcp.window_manager.win32gui")
+def test_list_windows_whitespace_filter(mock_gui: MagicMock) -> None:
+    """A whitespace-only filter also lists every window."""
+    _setup_enum_mock(mock_gui, {1: "Notepad", 2: "Chrome"})
+
+    result: list[WindowListEntry] = list_windows("   ")
+    assert len(result) == 2
+
+
 @patch("winsight_mcp.window_manager.win32gui")
 def test_list_windows_all_invisible(mock_gui: MagicMock) -> None:
     """Returns empty list when all enumerated windows are invisible."""
     _setup_enum_mock(mock_gui, {1: "Hidden", 2: "Also Hidden"})
-    mock_gui.IsWindowVisible.return_value = False
+    mock_gui.GetWindowLong.return_value = 0
 
     result: list[WindowListEntry] = list_windows()
     assert result == []
@@ -249,7 +311,7 @@ def test_list_windows_all_invisible(mock_gui: MagicMock) -> None:
 @patch("winsight_mcp.window_manager.win32gui")
 def test_find_window_found(mock_gui: MagicMock) -> None:
     """First matching window is returned with correct hwnd and title."""
-    mock_gui.IsWindowVisible.return_value = True
+    mock_gui.GetWindowLong.return_value = win32con.WS_VISIBLE
     mock_gui.GetWindowText.return_value = "My Notepad"
     mock_gui.GetWindowRect.return_value = (0, 0, 800, 600)
     mock_gui.GetWindowPlacement.return_value = (0, 0, (0, 0), (0, 0), (0, 0, 800, 600))
@@ -264,7 +326,7 @@ def test_find_window_found(mock_gui: MagicMock) -> None:
 @patch("winsight_mcp.window_manager.win32gui")
 def test_find_window_not_found(mock_gui: MagicMock) -> None:
     """Returns None when no window matches the title."""
-    mock_gui.IsWindowVisible.return_value = True
+    mock_gui.GetWindowLong.return_value = win32con.WS_VISIBLE
     mock_gui.GetWindowText.return_value = "Chrome"
     mock_gui.EnumWindows.side_effect = _enum_single(10)
 
@@ -275,7 +337,7 @@ def test_find_window_not_found(mock_gui: MagicMock) -> None:
 @patch("winsight_mcp.window_manager.win32gui")
 def test_find_window_stops_after_first_match(mock_gui: MagicMock) -> None:
     """The ``if ctx:`` guard prevents processing hwnds after first match."""
-    mock_gui.IsWindowVisible.return_value = True
+    mock_gui.GetWindowLong.return_value = win32con.WS_VISIBLE
     mock_gui.GetWindowText.return_value = "Notepad"
     mock_gui.GetWindowRect.return_value = (0, 0, 800, 600)
     mock_gui.GetWindowPlacement.return_value = (0, 0, (0, 0), (0, 0), (0, 0, 800, 600))
@@ -293,7 +355,7 @@ def test_find_window_stops_after_first_match(mock_gui: MagicMock) -> None:
     result: WindowInfo | None = find_window("notepad")
     assert result is not None
     assert result["hwnd"] == 10
-    assert mock_gui.IsWindowVisible.call_count == 1
+    assert mock_gui.GetWindowLong.call_count == 1
 
 
 @patch("winsight_mcp.window_manager.win32gui")
@@ -308,7 +370,7 @@ def test_find_window_enum_exception_swallowed(mock_gui: MagicMock) -> None:
 @patch("winsight_mcp.window_manager.win32gui")
 def test_find_window_exception_after_match(mock_gui: MagicMock) -> None:
     """Win32 EnumWindows raises when callback returns False; result is still returned."""
-    mock_gui.IsWindowVisible.return_value = True
+    mock_gui.GetWindowLong.return_value = win32con.WS_VISIBLE
     mock_gui.GetWindowText.return_value = "Notepad"
     mock_gui.GetWindowRect.return_value = (0, 0, 800, 600)
     mock_gui.GetWindowPlacement.return_value = (0, 0, (0, 0), (0, 0), (0, 0, 800, 600))
@@ -327,6 +389,123 @@ def test_find_window_exception_after_match(mock_gui: MagicMock) -> None:
     assert result["hwnd"] == 10
 
 
+@patch("winsight_mcp.window_manager.win32gui")
+def test_find_window_closed_after_enumeration(mock_gui: MagicMock) -> None:
+    """A match that closes before its rect is read yields None."""
+    mock_gui.GetWindowLong.return_value = win32con.WS_VISIBLE
+    mock_gui.GetWindowText.return_value = "Notepad"
+    mock_gui.GetWindowRect.side_effect = OSError("Invalid window handle")
+    mock_gui.EnumWindows.side_effect = _enum_single(10)
+
+    assert find_window("notepad") is None
+
+
+@patch("winsight_mcp.window_manager.win32gui")
+def test_find_hwnd_skips_rect_and_placement(mock_gui: MagicMock) -> None:
+    """find_hwnd returns (hwnd, title) without reading the window's geometry."""
+    mock_gui.GetWindowLong.return_value = win32con.WS_VISIBLE
+    mock_gui.GetWindowText.return_value = "My Notepad"
+    mock_gui.EnumWindows.side_effect = _enum_single(10)
+
+    assert find_hwnd("NOTEPAD") == (10, "My Notepad")
+    mock_gui.GetWindowRect.assert_not_called()
+    mock_gui.GetWindowPlacement.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# find_window_cached
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def _no_window_snapshot() -> Iterator[None]:
+    """Start and end each cached-lookup test without a window snapshot."""
+    window_manager._window_snapshot = None
+    yield
+    window_manager._window_snapshot = None
+
+
+@pytest.mark.usefixtures("_no_window_snapshot")
+@patch("winsight_mcp.window_manager.time")
+@patch("winsight_mcp.window_manager.win32gui")
+def test_find_window_cached_reuses_snapshot_within_ttl(
+    mock_gui: MagicMock, mock_time: MagicMock
+) -> None:
+    """Lookups within the TTL search the same EnumWindows snapshot."""
+    mock_time.monotonic.side_effect = [100.0, 100.1]
+    mock_gui.GetWindowLong.return_value = win32con.WS_VISIBLE
+    mock_gui.GetWindowText.return_value = "My Notepad"
+    mock_gui.GetWindowRect.return_value = (0, 0, 800, 600)
+    mock_gui.GetWindowPlacement.return_value = (0, 0, (0, 0), (0, 0), (0, 0, 800, 600))
+    mock_gui.EnumWindows.side_effect = _enum_single(10)
+
+    assert find_window_cached("chrome") is None
+    result: WindowInfo | None = find_window_cached("notepad")
+    assert result is not None
+    assert result["hwnd"] == 10
+    assert mock_gui.EnumWindows.call_count == 1
+
+
+@pytest.mark.usefixtures("_no_window_snapshot")
+@patch("winsight_mcp.window_manager.time")
+@patch("winsight_mcp.window_manager.win32gui")
+def test_find_window_cached_refreshes_after_ttl(
+    mock_gui: MagicMock, mock_time: MagicMock
+) -> None:
+    """A snapshot older than the TTL is re-enumerated."""
+    mock_time.monotonic.side_effect = [100.0, 100.0 + WINDOW_CACHE_TTL]
+    mock_gui.GetWindowLong.return_value = win32con.WS_VISIBLE
+    mock_gui.GetWindowText.return_value = "Chrome"
+    mock_gui.EnumWindows.side_effect = _enum_single(10)
+
+    find_window_cached("notepad")
+    find_window_cached("notepad")
+    assert mock_gui.EnumWindows.call_count == 2
+
+
+@pytest.mark.usefixtures("_no_window_snapshot")
+@patch("winsight_mcp.window_manager.time")
+@patch("winsight_mcp.window_manager.win32gui")
+def test_find_window_cached_skips_closed_window(
+    mock_gui: MagicMock, mock_time: MagicMock
+) -> None:
+    """A closed window in the snapshot is skipped for a later live match."""
+    mock_time.monotonic.return_value = 100.0
+    mock_gui.GetWindowLong.return_value = win32con.WS_VISIBLE
+    mock_gui.GetWindowText.side_effect = lambda hwnd: f"Notepad {hwnd}"
+
+    def _get_rect(hwnd: int) -> tuple[int, int, int, int]:
+        """Fail for the closed window, succeed for the live one."""
+        if hwnd == 10:
+            raise OSError("Invalid window handle")
+        return (0, 0, 800, 600)
+
+    mock_gui.GetWindowRect.side_effect = _get_rect
+    mock_gui.GetWindowPlacement.return_value = (0, 0, (0, 0), (0, 0), (0, 0, 800, 600))
+    mock_gui.EnumWindows.side_effect = _enum_many([10, 20])
+
+    result: WindowInfo | None = find_window_cached("notepad")
+    assert result is not None
+    assert result["hwnd"] == 20
+    assert result["title"] == "Notepad 20"
+
+
+@pytest.mark.usefixtures("_no_window_snapshot")
+@patch("winsight_mcp.window_manager.time")
+@patch("winsight_mcp.window_manager.win32gui")
+def test_find_window_cached_window_closed_since_snapshot(
+    mock_gui: MagicMock, mock_time: MagicMock
+) -> None:
+    """A snapshot entry whose window has since closed yields None."""
+    mock_time.monotonic.return_value = 100.0
+    mock_gui.GetWindowLong.return_value = win32con.WS_VISIBLE
+    mock_gui.GetWindowText.return_value = "Notepad"
+    mock_gui.GetWindowRect.side_effect = OSError("Invalid window handle")
+    mock_gui.EnumWindows.side_effect = _enum_single(10)
+
+    assert find_window_cached("notepad") is None
+
+
 # ---------------------------------------------------------------------------
 # get_window_info (unit-level, not via server)
 # ---------------------------------------------------------------------------
@@ -335,7 +514,7 @@ def test_find_window_exception_after_match(mock_gui: MagicMock) -> None:
 @patch("winsight_mcp.window_manager.win32gui")
 def test_get_window_info_found(mock_gui: MagicMock) -> None:
     """Returns PublicWindowInfo without hwnd and with active flag."""
-    mock_gui.IsWindowVisible.return_value = True
+    mock_gui.GetWindowLong.return_value = win32con.WS_VISIBLE
     mock_gui.GetWindowText.return_value = "My Editor"
     mock_gui.GetWindowRect.return_value = (10, 20, 810, 620)
     mock_gui.GetWindowPlacement.return_value = (
@@ -358,7 +537,7 @@ def test_get_window_info_found(mock_gui: MagicMock) -> None:
 @patch("winsight_mcp.window_manager.win32gui")
 def test_get_window_info_not_found(mock_gui: MagicMock) -> None:
     """Returns None when no window matches."""
-    mock_gui.IsWindowVisible.return_value = True
+    mock_gui.GetWindowLong.return_value = win32con.WS_VISIBLE
     mock_gui.GetWindowText.return_value = "Chrome"
     mock_gui.EnumWindows.side_effect = _enum_single(1)
 
@@ -374,7 +553,7 @@ def test_get_window_info_not_found(mock_gui: MagicMock) -> None:
 @patch("winsight_mcp.window_manager.win32gui")
 def test_get_window_rect_found(mock_gui: MagicMock) -> None:
     """Returns (left, top, width, height) tuple for a matching window."""
-    mock_gui.IsWindowVisible.return_value = True
+    mock_gui.GetWindowLong.return_value = win32con.WS_VISIBLE
     mock_gui.GetWindowText.return_value = "My App"
     mock_gui.GetWindowRect.return_value = (50, 100, 850, 700)
     mock_gui.GetWindowPlacement.return_value = (
@@ -393,7 +572,7 @@ def test_get_window_rect_found(mock_gui: MagicMock) -> None:
 @patch("winsight_mcp.window_manager.win32gui")
 def test_get_window_rect_not_found(mock_gui: MagicMock) -> None:
     """Returns None when no window matches."""
-    mock_gui.IsWindowVisible.return_value = True
+    mock_gui.GetWindowLong.return_value = win32con.WS_VISIBLE
     mock_gui.GetWindowText.return_value = "Chrome"
     mock_gui.EnumWindows.side_effect = _enum_single(1)
 
@@ -405,14 +584,15 @@ def test_get_window_rect_not_found(mock_gui: MagicMock) -> None:
 # ---------------------------------------------------------------------------
 
 
+@patch("winsight_mcp.window_manager.threading")
 @patch("winsight_mcp.window_manager.ctypes")
 @patch("winsight_mcp.window_manager.win32gui")
 def testforce_foreground_attaches_threads(
-    mock_gui: MagicMock, mock_ctypes: MagicMock
+    mock_gui: MagicMock, mock_ctypes: MagicMock, mock_threading: MagicMock
 ) -> None:
     """When current and foreground threads differ, AttachThreadInput is called."""
     mock_gui.GetForegroundWindow.return_value = 99
-    mock_ctypes.windll.kernel32.GetCurrentThreadId.return_value = 100
+    mock_threading.get_native_id.return_value = 100
     mock_ctypes.windll.user32.GetWindowThreadProcessId.return_value = 200
 
     force_foreground(42)
@@ -423,14 +603,15 @@ def testforce_foreground_attaches_threads(
     mock_gui.SetForegroundWindow.assert_called_once_with(42)
 
 
+@patch("winsight_mcp.window_manager.threading")
 @patch("winsight_mcp.window_manager.ctypes")
 @patch("winsight_mcp.window_manager.win32gui")
 def testforce_foreground_same_thread_skips_attach(
-    mock_gui: MagicMock, mock_ctypes: MagicMock
+    mock_gui: MagicMock, mock_ctypes: MagicMock, mock_threading: MagicMock
 ) -> None:
     """When current and foreground threads are the same, skip AttachThreadInput."""
     mock_gui.GetForegroundWindow.return_value = 99
-    mock_ctypes.windll.kernel32.GetCurrentThreadId.return_value = 100
+    mock_threading.get_native_id.return_value = 100
     mock_ctypes.windll.user32.GetWindowThreadProcessId.return_value = 100
 
     force_foreground(42)
@@ -439,14 +620,15 @@ def testforce_foreground_same_thread_skips_attach(
     mock_gui.BringWindowToTop.assert_called_once_with(42)
 
 
+@patch("winsight_mcp.window_manager.threading")
 @patch("winsight_mcp.window_manager.ctypes")
 @patch("winsight_mcp.window_manager.win32gui")
 def testforce_foreground_detaches_on_exception(
-    mock_gui: MagicMock, mock_ctypes: MagicMock
+    mock_gui: MagicMock, mock_ctypes: MagicMock, mock_threading: MagicMock
 ) -> None:
     """Thread input is detached even when BringWindowToTop raises."""
     mock_gui.GetForegroundWindow.return_value = 99
-    mock_ctypes.windll.kernel32.GetCurrentThreadId.return_value = 100
+    mock_threading.get_native_id.return_value = 100
     mock_ctypes.windll.user32.GetWindowThreadProcessId.return_value = 200
     mock_gui.BringWindowToTop.side_effect = OSError("Access denied")
 
@@ -464,22 +646,22 @@ def testforce_foreground_detaches_on_exception(
 
 @patch("winsight_mcp.window_manager.win32gui")
 @patch("winsight_mcp.window_manager.force_foreground")
-@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.find_hwnd")
 def test_focus_window_success(
     mock_find: MagicMock,
     mock_force: MagicMock,
     mock_gui: MagicMock,
-    sample_window_info: WindowInfo,
+    sample_window_match: tuple[int, str],
 ) -> None:
     """Non-minimized window is focused without calling ShowWindow."""
-    mock_find.return_value = sample_window_info
+    mock_find.return_value = sample_window_match
     result: str = focus_window("test")
     assert "now focused" in result
-    mock_force.assert_called_once_with(sample_window_info["hwnd"])
+    mock_force.assert_called_once_with(sample_window_match[0])
     mock_gui.ShowWindow.assert_not_called()
 
 
-@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.find_hwnd")
 def test_focus_window_not_found(mock_find: MagicMock) -> None:
     """Returns 'not found' message when window does not exist."""
     mock_find.return_value = None
@@ -490,40 +672,68 @@ def test_focus_window_not_found(mock_find: MagicMock) -> None:
 @patch("winsight_mcp.window_manager.time")
 @patch("winsight_mcp.window_manager.force_foreground")
 @patch("winsight_mcp.window_manager.win32gui")
-@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.find_hwnd")
 def test_focus_window_restores_minimized(
     mock_find: MagicMock,
     mock_gui: MagicMock,
     mock_force: MagicMock,
     mock_time: MagicMock,
-    sample_window_info: WindowInfo,
+    sample_window_match: tuple[int, str],
 ) -> None:
-    """Minimized window triggers ShowWindow(SW_RESTORE) + sleep before focus."""
-    info: WindowInfo = {
-        "title": sample_window_info["title"],
-        "hwnd": sample_window_info["hwnd"],
-        "left": sample_window_info["left"],
-        "top": sample_window_info["top"],
-        "width": sample_window_info["width"],
-        "height": sample_window_info["height"],
-        "minimized": True,
-        "maximized": sample_window_info["maximized"],
-    }
-    mock_find.return_value = info
+    """Minimized window is restored, then focused once it is no longer iconic."""
+    mock_find.return_value = sample_window_match
+    mock_gui.GetWindowPlacement.return_value = (
+        0,
+        win32con.SW_SHOWMINIMIZED,
+        (0, 0),
+        (0, 0),
+        (0, 0, 800, 600),
+    )
+    mock_gui.IsIconic.side_effect = [True, True, False]
+    mock_time.monotonic.return_value = 0.0
     result: str = focus_window("minimized")
     assert "now focused" in result
-    mock_gui.ShowWindow.assert_called_once_with(info["hwnd"], win32con.SW_RESTORE)
-    mock_time.sleep.assert_called_once_with(0.3)
-    mock_force.assert_called_once_with(info["hwnd"])
+    hwnd: int = sample_window_match[0]
+    mock_gui.ShowWindow.assert_called_once_with(hwnd, win32con.SW_RESTORE)
+    assert mock_time.sleep.call_args_list == [call(RESTORE_POLL_INTERVAL)] * 2
+    mock_force.assert_called_once_with(hwnd)
 
 
+@patch("winsight_mcp.window_manager.time")
 @patch("winsight_mcp.window_manager.force_foreground")
-@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.win32gui")
+@patch("winsight_mcp.window_manager.find_hwnd")
+def test_focus_window_restore_wait_is_bounded(
+    mock_find: MagicMock,
+    mock_gui: MagicMock,
+    mock_force: MagicMock,
+    mock_time: MagicMock,
+    sample_window_match: tuple[int, str],
+) -> None:
+    """A window that stays minimized is focused anyway after RESTORE_TIMEOUT."""
+    mock_find.return_value = sample_window_match
+    mock_gui.GetWindowPlacement.return_value = (
+        0,
+        win32con.SW_SHOWMINIMIZED,
+        (0, 0),
+        (0, 0),
+        (0, 0, 800, 600),
+    )
+    mock_gui.IsIconic.return_value = True
+    mock_time.monotonic.side_effect = [0.0, 0.1, 0.2, RESTORE_TIMEOUT]
+    result: str = focus_window("minimized")
+    assert "now focused" in result
+    assert mock_time.sleep.call_count == 2
+    mock_force.assert_called_once_with(sample_window_match[0])
+
+
+@patch("winsight_mcp.window_manager.force_foreground")
+@patch("winsight_mcp.window_manager.find_hwnd")
 def test_focus_window_exception(
-    mock_find: MagicMock, mock_force: MagicMock, sample_window_info: WindowInfo
+    mock_find: MagicMock, mock_force: MagicMock, sample_window_match: tuple[int, str]
 ) -> None:
     """Exception in force_foreground is caught and returns failure message."""
-    mock_find.return_value = sample_window_info
+    mock_find.return_value = sample_window_match
     mock_force.side_effect = OSError("Access denied")
     result: str = focus_window("broken")
     assert "Failed to focus" in result
@@ -536,16 +746,16 @@ def test_focus_window_exception(
 
 
 @patch("winsight_mcp.window_manager.win32gui")
-@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.find_hwnd")
 def test_resize_window_success(
-    mock_find: MagicMock, mock_gui: MagicMock, sample_window_info: WindowInfo
+    mock_find: MagicMock, mock_gui: MagicMock, sample_window_match: tuple[int, str]
 ) -> None:
     """Calls SetWindowPos with SWP_NOMOVE to resize only."""
-    mock_find.return_value = sample_window_info
+    mock_find.return_value = sample_window_match
     result: str = resize_window("test", 1024, 768)
     assert "resized to 1024x768" in result
     mock_gui.SetWindowPos.assert_called_once_with(
-        sample_window_info["hwnd"],
+        sample_window_match[0],
         win32con.HWND_TOP,
         0,
         0,
@@ -555,7 +765,7 @@ def test_resize_window_success(
     )
 
 
-@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.find_hwnd")
 def test_resize_window_not_found(mock_find: MagicMock) -> None:
     """Returns 'not found' when window does not exist."""
     mock_find.return_value = None
@@ -564,12 +774,12 @@ def test_resize_window_not_found(mock_find: MagicMock) -> None:
 
 
 @patch("winsight_mcp.window_manager.win32gui")
-@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.find_hwnd")
 def test_resize_window_exception(
-    mock_find: MagicMock, mock_gui: MagicMock, sample_window_info: WindowInfo
+    mock_find: MagicMock, mock_gui: MagicMock, sample_window_match: tuple[int, str]
 ) -> None:
     """SetWindowPos exception is caught and returns failure message."""
-    mock_find.return_value = sample_window_info
+    mock_find.return_value = sample_window_match
     mock_gui.SetWindowPos.side_effect = OSError("Access denied")
     result: str = resize_window("test", 1024, 768)
     assert "Failed to resize" in result
@@ -582,16 +792,16 @@ def test_resize_window_exception(
 
 
 @patch("winsight_mcp.window_manager.win32gui")
-@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.find_hwnd")
 def test_move_window_success(
-    mock_find: MagicMock, mock_gui: MagicMock, sample_window_info: WindowInfo
+    mock_find: MagicMock, mock_gui: MagicMock, sample_window_match: tuple[int, str]
 ) -> None:
     """Calls SetWindowPos with SWP_NOSIZE to move only."""
-    mock_find.return_value = sample_window_info
+    mock_find.return_value = sample_window_match
     result: str = move_window("test", 50, 100)
     assert "moved to (50, 100)" in result
     mock_gui.SetWindowPos.assert_called_once_with(
-        sample_window_info["hwnd"],
+        sample_window_match[0],
         win32con.HWND_TOP,
         50,
         100,
@@ -601,7 +811,7 @@ def test_move_window_success(
     )
 
 
-@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.find_hwnd")
 def test_move_window_not_found(mock_find: MagicMock) -> None:
     """Returns 'not found' when window does not exist."""
     mock_find.return_value = None
@@ -610,12 +820,12 @@ def test_move_window_not_found(mock_find: MagicMock) -> None:
 
 
 @patch("winsight_mcp.window_manager.win32gui")
-@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.find_hwnd")
 def test_move_window_exception(
-    mock_find: MagicMock, mock_gui: MagicMock, sample_window_info: WindowInfo
+    mock_find: MagicMock, mock_gui: MagicMock, sample_window_match: tuple[int, str]
 ) -> None:
     """SetWindowPos exception is caught and returns failure message."""
-    mock_find.return_value = sample_window_info
+    mock_find.return_value = sample_window_match
     mock_gui.SetWindowPos.side_effect = OSError("Access denied")
     result: str = move_window("test", 50, 100)
     assert "Failed to move" in result
@@ -628,20 +838,20 @@ def test_move_window_exception(
 
 
 @patch("winsight_mcp.window_manager.win32gui")
-@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.find_hwnd")
 def test_minimize_window_success(
-    mock_find: MagicMock, mock_gui: MagicMock, sample_window_info: WindowInfo
+    mock_find: MagicMock, mock_gui: MagicMock, sample_window_match: tuple[int, str]
 ) -> None:
     """Calls ShowWindow with SW_MINIMIZE."""
-    mock_find.return_value = sample_window_info
+    mock_find.return_value = sample_window_match
     result: str = minimize_window("test")
     assert "minimized" in result
     mock_gui.ShowWindow.assert_called_once_with(
-        sample_window_info["hwnd"], win32con.SW_MINIMIZE
+        sample_window_match[0], win32con.SW_MINIMIZE
     )
 
 
-@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.find_hwnd")
 def test_minimize_window_not_found(mock_find: MagicMock) -> None:
     """Returns 'not found' when window does not exist."""
     mock_find.return_value = None
@@ -650,12 +860,12 @@ def test_minimize_window_not_found(mock_find: MagicMock) -> None:
 
 
 @patch("winsight_mcp.window_manager.win32gui")
-@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.find_hwnd")
 def test_minimize_window_exception(
-    mock_find: MagicMock, mock_gui: MagicMock, sample_window_info: WindowInfo
+    mock_find: MagicMock, mock_gui: MagicMock, sample_window_match: tuple[int, str]
 ) -> None:
     """ShowWindow exception is caught and returns failure message."""
-    mock_find.return_value = sample_window_info
+    mock_find.return_value = sample_window_match
     mock_gui.ShowWindow.side_effect = OSError("Access denied")
     result: str = minimize_window("test")
     assert "Failed to minimize" in result
@@ -668,20 +878,20 @@ def test_minimize_window_exception(
 
 
 @patch("winsight_mcp.window_manager.win32gui")
-@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.find_hwnd")
 def test_maximize_window_success(
-    mock_find: MagicMock, mock_gui: MagicMock, sample_window_info: WindowInfo
+    mock_find: MagicMock, mock_gui: MagicMock, sample_window_match: tuple[int, str]
 ) -> None:
     """Calls ShowWindow with SW_MAXIMIZE."""
-    mock_find.return_value = sample_window_info
+    mock_find.return_value = sample_window_match
     result: str = maximize_window("test")
     assert "maximized" in result
     mock_gui.ShowWindow.assert_called_once_with(
-        sample_window_info["hwnd"], win32con.SW_MAXIMIZE
+        sample_window_match[0], win32con.SW_MAXIMIZE
     )
 
 
-@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.find_hwnd")
 def test_maximize_window_not_found(mock_find: MagicMock) -> None:
     """Returns 'not found' when window does not exist."""
     mock_find.return_value = None
@@ -690,12 +900,12 @@ def test_maximize_window_not_found(mock_find: MagicMock) -> None:
 
 
 @patch("winsight_mcp.window_manager.win32gui")
-@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.find_hwnd")
 def test_maximize_window_exception(
-    mock_find: MagicMock, mock_gui: MagicMock, sample_window_info: WindowInfo
+    mock_find: MagicMock, mock_gui: MagicMock, sample_window_match: tuple[int, str]
 ) -> None:
     """ShowWindow exception is caught and returns failure message."""
-    mock_find.return_value = sample_window_info
+    mock_find.return_value = sample_window_match
     mock_gui.ShowWindow.side_effect = OSError("Access denied")
     result: str = maximize_window("test")
     assert "Failed to maximize" in result
@@ -708,20 +918,20 @@ def test_maximize_window_exception(
 
 
 @patch("winsight_mcp.window_manager.win32gui")
-@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.find_hwnd")
 def test_restore_window_success(
-    mock_find: MagicMock, mock_gui: MagicMock, sample_window_info: WindowInfo
+    mock_find: MagicMock, mock_gui: MagicMock, sample_window_match: tuple[int, str]
 ) -> None:
     """Calls ShowWindow with SW_RESTORE."""
-    mock_find.return_value = sample_window_info
+    mock_find.return_value = sample_window_match
     result: str = restore_window("test")
     assert "restored" in result
     mock_gui.ShowWindow.assert_called_once_with(
-        sample_window_info["hwnd"], win32con.SW_RESTORE
+        sample_window_match[0], win32con.SW_RESTORE
     )
 
 
-@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.find_hwnd")
 def test_restore_window_not_found(mock_find: MagicMock) -> None:
     """Returns 'not found' when window does not exist."""
     mock_find.return_value = None
@@ -730,30 +940,135 @@ def test_restore_window_not_found(mock_find: MagicMock) -> None:
 
 
 @patch("winsight_mcp.window_manager.win32gui")
-@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.find_hwnd")
 def test_restore_window_exception(
-    mock_find: MagicMock, mock_gui: MagicMock, sample_window_info: WindowInfo
+    mock_find: MagicMock, mock_gui: MagicMock, sample_window_match: tuple[int, str]
 ) -> None:
     """ShowWindow exception is caught and returns failure message."""
-    mock_find.return_value = sample_window_info
+    mock_find.return_value = sample_window_match
     mock_gui.ShowWindow.side_effect = OSError("Access denied")
     result: str = restore_window("test")
     assert "Failed to restore" in result
     assert "Access denied" in result
 
 
+# ---------------------------------------------------------------------------
+# windows_batch
+# ---------------------------------------------------------------------------
+
+
+@patch("winsight_mcp.window_manager.titled_windows")
+@patch("winsight_mcp.window_manager.win32gui")
+def test_windows_batch_enumerates_once(
+    mock_gui: MagicMock, mock_titled: MagicMock
+) -> None:
+    """Every operation resolves against a single window snapshot."""
+    mock_titled.return_value = [(10, "Notepad"), (20, "Calculator")]
+    results: list[str] = windows_batch(
+        [
+            {"action": "minimize", "window_title": "notepad"},
+            {"action": "resize", "window_title": "CALC", "width": 640, "height": 480},
+            {"action": "move", "window_title": "note", "x": 5, "y": 6},
+        ]
+    )
+    assert results == [
+        "Window 'Notepad' minimized",
+        "Window 'Calculator' resized to 640x480",
+        "Window 'Notepad' moved to (5, 6)",
+    ]
+    mock_titled.assert_called_once()
+    mock_gui.ShowWindow.assert_called_once_with(10, win32con.SW_MINIMIZE)
+    assert mock_gui.SetWindowPos.call_args_list == [
+        call(
+            20,
+            win32con.HWND_TOP,
+            0,
+            0,
+            640,
+            480,
+            win32con.SWP_NOMOVE | win32con.SWP_NOZORDER,
+        ),
+        call(
+            10,
+            win32con.HWND_TOP,
+            5,
+            6,
+            0,
+            0,
+            win32con.SWP_NOSIZE | win32con.SWP_NOZORDER,
+        ),
+    ]
+
+
+@patch("winsight_mcp.window_manager.titled_windows")
+@patch("winsight_mcp.window_manager.win32gui")
+def test_windows_batch_reports_bad_operations(
+    mock_gui: MagicMock, mock_titled: MagicMock
+) -> None:
+    """Unknown actions, missing arguments and missing windows fail per operation."""
+    mock_titled.return_value = [(10, "Notepad")]
+    mock_gui.ShowWindow.side_effect = OSError("Access denied")
+    results: list[str] = windows_batch(
+        [
+            {"action": "close", "window_title": "Notepad"},
+            {"action": "resize", "window_title": "Notepad", "width": 640},
+            {"action": "restore", "window_title": "Chrome"},
+            {"action": "restore", "window_title": "Notepad"},
+        ]
+    )
+    assert results == [
+        "Unknown action 'close' for window 'Notepad'",
+        "Resize of 'Notepad' needs width and height",
+        "No window found matching 'Chrome'",
+        "Failed to restore window 'Notepad': Access denied",
+    ]
+    mock_gui.SetWindowPos.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # wait_for_window
 # ---------------------------------------------------------------------------
 
+_NO_HOOKS: OSError = OSError("SetWinEventHook failed")
+
 
 @patch("winsight_mcp.window_manager.time")
-@patch("winsight_mcp.window_manager.find_window")
-def test_wait_for_window_found_immediately(
-    mock_find: MagicMock, mock_time: MagicMock, sample_window_info: WindowInfo
+@patch("winsight_mcp.window_manager.wait_for_window_event")
+def test_wait_for_window_event_found(
+    mock_event: MagicMock, mock_time: MagicMock, sample_window_info: WindowInfo
+) -> None:
+    """A window reported by the event wait is returned without polling."""
+    mock_event.return_value = sample_window_info
+    result: str = wait_for_window("test", timeout=10)
+    assert result == "Window found: 'Test Window'"
+    mock_event.assert_called_once_with("test", 10)
+    mock_time.sleep.assert_not_called()
+
+
+@patch("winsight_mcp.window_manager.find_window_cached")
+@patch("winsight_mcp.window_manager.wait_for_window_event")
+def test_wait_for_window_event_timeout(
+    mock_event: MagicMock, mock_find: MagicMock
 ) -> None:
-    """Window exists on first poll."""
-    mock_time.time.side_effect = [0.0, 0.0]  # start, first check
+    """An event wait that times out reports a timeout without falling back."""
+    mock_event.return_value = None
+    result: str = wait_for_window("ghost", timeout=5)
+    assert "Timed out" in result
+    assert "ghost" in result
+    mock_find.assert_not_called()
+
+
+@patch("winsight_mcp.window_manager.wait_for_window_event", side_effect=_NO_HOOKS)
+@patch("winsight_mcp.window_manager.time")
+@patch("winsight_mcp.window_manager.find_window_cached")
+def test_wait_for_window_polling_found_immediately(
+    mock_find: MagicMock,
+    mock_time: MagicMock,
+    _mock_event: MagicMock,
+    sample_window_info: WindowInfo,
+) -> None:
+    """Without event hooks, a window present on the first poll is returned."""
+    mock_time.monotonic.side_effect = [0.0, 0.0]  # start, first check
     mock_find.return_value = sample_window_info
     result: str = wait_for_window("test")
     assert "Window found" in result
@@ -761,40 +1076,165 @@ def test_wait_for_window_found_immediately(
     mock_time.sleep.assert_not_called()
 
 
+@patch("winsight_mcp.window_manager.wait_for_window_event", side_effect=_NO_HOOKS)
 @patch("winsight_mcp.window_manager.time")
-@patch("winsight_mcp.window_manager.find_window")
-def test_wait_for_window_found_after_retries(
-    mock_find: MagicMock, mock_time: MagicMock, sample_window_info: WindowInfo
+@patch("winsight_mcp.window_manager.find_window_cached")
+def test_wait_for_window_polling_found_after_retries(
+    mock_find: MagicMock,
+    mock_time: MagicMock,
+    _mock_event: MagicMock,
+    sample_window_info: WindowInfo,
 ) -> None:
     """Window appears after a few polling iterations."""
-    mock_time.time.side_effect = [0.0, 1.0, 1.0, 2.0, 2.0]
+    mock_time.monotonic.side_effect = [0.0, 1.0, 1.0, 2.0, 2.0]
     mock_find.side_effect = [None, sample_window_info]
     result: str = wait_for_window("test", timeout=10)
     assert "Window found" in result
-    mock_time.sleep.assert_called_with(0.2)  # elapsed < 5 so 0.2s interval
+    mock_time.sleep.assert_called_once_with(POLL_BACKOFF[0])
 
 
+@patch("winsight_mcp.window_manager.wait_for_window_event", side_effect=_NO_HOOKS)
 @patch("winsight_mcp.window_manager.time")
-@patch("winsight_mcp.window_manager.find_window")
-def test_wait_for_window_timeout(mock_find: MagicMock, mock_time: MagicMock) -> None:
+@patch("winsight_mcp.window_manager.find_window_cached")
+def test_wait_for_window_polling_timeout(
+    mock_find: MagicMock, mock_time: MagicMock, _mock_event: MagicMock
+) -> None:
     """Window never appears; function times out."""
-    mock_time.time.side_effect = [0.0, 1.0, 1.0, 31.0]
+    mock_time.monotonic.side_effect = [0.0, 1.0, 1.0, 31.0]
     mock_find.return_value = None
     result: str = wait_for_window("nonexistent", timeout=30)
     assert "Timed out" in result
     assert "nonexistent" in result
 
 
+@patch("winsight_mcp.window_manager.wait_for_window_event", side_effect=_NO_HOOKS)
 @patch("winsight_mcp.window_manager.time")
-@patch("winsight_mcp.window_manager.find_window")
-def test_wait_for_window_adaptive_polling(
-    mock_find: MagicMock, mock_time: MagicMock
+@patch("winsight_mcp.window_manager.find_window_cached")
+def test_wait_for_window_polling_backoff(
+    mock_find: MagicMock, mock_time: MagicMock, _mock_event: MagicMock
 ) -> None:
-    """After 5 seconds elapsed, polling switches from 0.2s to 0.5s."""
-    mock_time.time.side_effect = [0.0, 1.0, 1.0, 6.0, 6.0, 31.0]
+    """Sleep intervals follow POLL_BACKOFF and stay capped at its last entry."""
+    mock_time.monotonic.side_effect = [0.0] + [1.0] * 8 + [31.0]
     mock_find.return_value = None
     result: str = wait_for_window("nonexistent", timeout=30)
     assert "Timed out" in result
-    sleep_calls = mock_time.sleep.call_args_list
-    assert call(0.2) in sleep_calls
-    assert call(0.5) in sleep_calls
+    assert mock_time.sleep.call_args_list == [
+        call(0.025),
+        call(0.05),
+        call(0.1),
+        call(0.2),
+        call(0.3),
+        call(0.5),
+        call(0.5),
+        call(0.5),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# wait_for_window_event
+# ---------------------------------------------------------------------------
+
+
+def _setup_hook_mocks(mock_ctypes: MagicMock, hooks: list[int]) -> MagicMock:
+    """Make SetWinEventHook return the given handles and the queue start empty."""
+    user32: MagicMock = mock_ctypes.windll.user32
+    user32.SetWinEventHook.side_effect = hooks
+    user32.PeekMessageW.return_value = 0
+    user32.GetAncestor.side_effect = lambda hwnd, flag: hwnd
+    return user32
+
+
+@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.ctypes")
+def test_wait_for_window_event_hook_failure_raises(
+    mock_ctypes: MagicMock, mock_find: MagicMock
+) -> None:
+    """A failed SetWinEventHook raises OSError and unhooks the one that succeeded."""
+    user32: MagicMock = _setup_hook_mocks(mock_ctypes, [11, 0])
+
+    with pytest.raises(OSError, match="SetWinEventHook failed"):
+        wait_for_window_event("test", 5)
+    user32.UnhookWinEvent.assert_called_once_with(11)
+    mock_find.assert_not_called()
+
+
+@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.ctypes")
+def test_wait_for_window_event_already_present(
+    mock_ctypes: MagicMock, mock_find: MagicMock, sample_window_info: WindowInfo
+) -> None:
+    """A window that exists once the hooks are set is returned immediately."""
+    user32: MagicMock = _setup_hook_mocks(mock_ctypes, [11, 12])
+    mock_find.return_value = sample_window_info
+
+    assert wait_for_window_event("test", 5) == sample_window_info
+    user32.MsgWaitForMultipleObjects.assert_not_called()
+    assert user32.UnhookWinEvent.call_args_list == [call(11), call(12)]
+
+
+@patch("winsight_mcp.window_manager.build_window_info")
+@patch("winsight_mcp.window_manager.is_candidate")
+@patch("winsight_mcp.window_manager.time")
+@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.ctypes")
+def test_wait_for_window_event_matching_show_event(
+    mock_ctypes: MagicMock,
+    mock_find: MagicMock,
+    mock_time: MagicMock,
+    mock_candidate: MagicMock,
+    mock_build: MagicMock,
+    sample_window_info: WindowInfo,
+) -> None:
+    """Only a top-level matching window's event ends the wait."""
+    user32: MagicMock = _setup_hook_mocks(mock_ctypes, [11, 12])
+    mock_find.return_value = None
+    mock_time.monotonic.side_effect = [100.0, 100.0]
+    mock_candidate.side_effect = lambda hwnd, title: (
+        "Test Window" if hwnd == 77 else None
+    )
+    mock_build.return_value = sample_window_info
+
+    def _deliver_events(*_args: object) -> int:
+        """Fire events the way the hook would while the thread waits."""
+        proc = user32.SetWinEventHook.call_args[0][3]
+        proc(None, EVENT_OBJECT_SHOW, 55, 0, 0, 1, 0)  # visible, no match
+        proc(None, EVENT_OBJECT_SHOW, 77, -4, 0, 1, 0)  # not OBJID_WINDOW
+        proc(None, EVENT_OBJECT_SHOW, 77, 0, 0, 1, 0)  # match
+        return 0
+
+    user32.MsgWaitForMultipleObjects.side_effect = _deliver_events
+
+    assert wait_for_window_event("test", 5) == sample_window_info
+    mock_build.assert_called_once_with(77, "Test Window")
+    assert mock_candidate.call_count == 2
+    assert user32.UnhookWinEvent.call_args_list == [call(11), call(12)]
+
+
+@patch("winsight_mcp.window_manager.time")
+@patch("winsight_mcp.window_manager.find_window")
+@patch("winsight_mcp.window_manager.ctypes")
+def test_wait_for_window_event_timeout_returns_none(
+    mock_ctypes: MagicMock, mock_find: MagicMock, mock_time: MagicMock
+) -> None:
+    """No matching event before the deadline returns None and unhooks."""
+    user32: MagicMock = _setup_hook_mocks(mock_ctypes, [11, 12])
+    mock_find.return_value = None
+    mock_time.monotonic.side_effect = [100.0, 102.0, 105.0]
+
+    assert wait_for_window_event("ghost", 5) is None
+    user32.MsgWaitForMultipleObjects.assert_called_once_with(
+        0, None, False, 3001, QS_ALLINPUT
+    )
+    assert user32.UnhookWinEvent.call_args_list == [call(11), call(12)]
+
+
+@patch("winsight_mcp.window_manager.ctypes")
+def test_pump_messages_dispatches_until_queue_empty(mock_ctypes: MagicMock) -> None:
+    """Every queued message is translated and dispatched, then pumping stops."""
+    user32: MagicMock = mock_ctypes.windll.user32
+    user32.PeekMessageW.side_effect = [1, 1, 0]
+
+    window_manager._pump_messages()
+    assert user32.PeekMessageW.call_count == 3
+    assert user32.TranslateMessage.call_count == 2
+    assert user32.DispatchMessageW.call_count == 2